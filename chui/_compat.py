@@ -0,0 +1,8 @@
+# chui/_compat.py
+"""Python version compatibility helpers"""
+
+import sys
+
+# Keyword arguments for slotted dataclasses where supported (Python 3.10+):
+# @dataclass(**DATACLASS_SLOTS)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Type, Callable
 
 from chui.ui import UI
 from .config import Config
+from chui.plugins.base import route_debug_to_ui
 from chui.plugins.registry import PluginRegistry
 from .commands import BaseCommand
 from .protocols import CLIProtocol
@@ -40,7 +41,12 @@ class ChuiCLI(cmd2.Cmd, CLIProtocol):
         self.config.init_ui(self.ui)
         self.ui.debug("Config initialized")
 
-        self.events = EventManager()
+        # Plugin log output goes through the UI; with no log file the root
+        # logger writes to the terminal too, so records stop here instead
+        if self.config.get('system.debug', False):
+            route_debug_to_ui(self.ui, propagate=bool(self.config.get('paths.log_file')))
+
+        self.events = EventManager(max_completed=self.config.get('events.max_completed', 1024))
         self.ui.debug("Event Manager initialized")
 
         self.error_handler = ErrorHandler(self.ui)
@@ -55,6 +61,8 @@ class ChuiCLI(cmd2.Cmd, CLIProtocol):
 
         # Dictionary to store plugin command instances
         self._plugin_commands = {}
+        # Commands of deferred plugins, mapped to the loader for their plugin
+        self._lazy_commands = {}
 
         # Add debug before plugin registry initialization
         self.ui.debug("Initializing Plugin Registry...")
@@ -78,10 +86,15 @@ class ChuiCLI(cmd2.Cmd, CLIProtocol):
         def on_plugin_loaded(event):
             self.ui.success(f"Plugin loaded: {event.data['plugin_name']} v{event.data['version']}")
             
+        def on_plugins_loaded(event):
+            for loaded in event.data['plugins']:
+                self.ui.success(f"Plugin loaded: {loaded['plugin_name']} v{loaded['version']}")
+
         def on_plugin_unloaded(event):
             self.ui.info(f"Plugin unloaded: {event.data['plugin_name']}")
             
         self.events.subscribe('plugin_loaded', on_plugin_loaded)
+        self.events.subscribe('plugins_loaded', on_plugins_loaded)
         self.events.subscribe('plugin_unloaded', on_plugin_unloaded)
     
     def _get_intro(self) -> str:
@@ -250,6 +263,7 @@ class ChuiCLI(cmd2.Cmd, CLIProtocol):
 
             # Store command instance
             self._plugin_commands[name] = command_instance
+            self._lazy_commands.pop(name, None)
 
             if self.debug:
                 self.ui.debug(f"Registered command: {name}")
@@ -264,6 +278,44 @@ class ChuiCLI(cmd2.Cmd, CLIProtocol):
             )
             raise
     
+    def register_lazy_command(self, name: str, loader: Callable[[], None]) -> None:
+        """Register a placeholder command that loads its plugin on first use"""
+        def do_command(self_cmd, statement: str = '') -> bool:
+            try:
+                command = self.get_command(name)
+            except Exception as e:
+                self.error_handler.handle(
+                    error=e,
+                    category=ErrorCategory.PLUGIN,
+                    severity=ErrorSeverity.ERROR,
+                    operation=f"load_command({name})",
+                    debug=self.debug
+                )
+                return False
+
+            if not command:
+                self.ui.error(f"Command {name} is not available")
+                return False
+
+            # The plugin has replaced this placeholder with the real command
+            return getattr(self_cmd, f'do_{name}')(statement)
+
+        def help_command(self_cmd):
+            try:
+                command = self.get_command(name)
+            except Exception as e:
+                self.ui.error(f"Could not load help for {name}: {str(e)}")
+                return
+            if command:
+                command.show_help()
+
+        setattr(ChuiCLI, f'do_{name}', do_command)
+        setattr(ChuiCLI, f'help_{name}', help_command)
+        self._lazy_commands[name] = loader
+
+        if self.debug:
+            self.ui.debug(f"Registered deferred command: {name}")
+
     def do_plugins(self, arg: str) -> None:
         """
         Manage plugins
@@ -283,21 +335,24 @@ class ChuiCLI(cmd2.Cmd, CLIProtocol):
             cmd = args[0].lower()
             
             if cmd == 'list':
-                if not self.plugins.plugins:
+                names = self.plugins.get_plugin_names()
+                if not names:
                     self.ui.warning("No plugins loaded")
                     return
                     
-                # Show plugins table
-                headers = ["Name", "Version", "Commands", "Dependencies"]
+                # Show plugins table, including plugins deferred until first use
+                headers = ["Name", "Version", "Status", "Commands", "Dependencies"]
                 rows = []
-                for name, plugin in self.plugins.plugins.items():
+                for name in names:
+                    info = self.plugins.get_plugin_info(name)
                     rows.append([
                         name,
-                        plugin.version,
+                        info['version'],
+                        info['status'],
                         ", ".join(self.plugins.get_plugin_commands(name)),
-                        ", ".join(plugin.dependencies) or "none"
+                        ", ".join(info['dependencies']) or "none"
                     ])
-                self.ui.table(headers, rows, "Loaded Plugins")
+                self.ui.table(headers, rows, "Plugins")
                 
             elif cmd == 'load' and len(args) > 1:
                 self.plugins.load_plugin(args[1])
@@ -310,17 +365,18 @@ class ChuiCLI(cmd2.Cmd, CLIProtocol):
                 
             elif cmd == 'info' and len(args) > 1:
                 name = args[1]
-                plugin = self.plugins.plugins.get(name)
-                if not plugin:
+                info = self.plugins.get_plugin_info(name)
+                if not info:
                     self.ui.error(f"Plugin not found: {name}")
                     return
                     
                 # Show plugin details
                 self.ui.panel(f"""
                 Plugin: {name}
-                Version: {plugin.version}
+                Version: {info['version']}
+                Status: {info['status']}
                 Commands: {', '.join(self.plugins.get_plugin_commands(name))}
-                Dependencies: {', '.join(plugin.dependencies) or 'none'}
+                Dependencies: {', '.join(info['dependencies']) or 'none'}
                 """, title=f"Plugin Information: {name}")
                 
             else:
@@ -585,15 +641,20 @@ class ChuiCLI(cmd2.Cmd, CLIProtocol):
             )
 
     def get_command(self, name: str) -> Optional[BaseCommand]:
-        """Get a registered command"""
-        return self._plugin_commands.get(name)
+        """Get a registered command, loading its plugin if it was deferred"""
+        command = self._plugin_commands.get(name)
+        if command is None and name in self._lazy_commands:
+            self._lazy_commands[name]()
+            command = self._plugin_commands.get(name)
+        return command
     
     def unregister_command(self, name: str) -> None:
         """Unregister a command"""
-        if name in self._plugin_commands:
+        if name in self._plugin_commands or name in self._lazy_commands:
             delattr(ChuiCLI, f'do_{name}')
             delattr(ChuiCLI, f'help_{name}')
-            del self._plugin_commands[name]
+            self._plugin_commands.pop(name, None)
+            self._lazy_commands.pop(name, None)
             
             if self.debug:
                 self.ui.debug(f"Unregistered command: {name}")
@@ -95,8 +95,7 @@ class CommandPipeline:
                     "command": context.name,
                     "args": context.args,
                     "host": context.host
-                },
-                timestamp=datetime.now()
+                }
             ))
 
             result.status = CommandStatus.RUNNING
@@ -123,8 +122,7 @@ class CommandPipeline:
                     "command_id": str(context.command_id),
                     "exit_code": result.exit_code,
                     "duration": (result.end_time - result.start_time).total_seconds()
-                },
-                timestamp=datetime.now()
+                }
             ))
 
         except Exception as e:
@@ -142,8 +140,7 @@ class CommandPipeline:
                 data={
                     "command_id": str(context.command_id),
                     "error": str(e)
-                },
-                timestamp=datetime.now()
+                }
             ))
 
             # Handle error
@@ -337,6 +334,5 @@ class CommandPipeline:
         # Emit cancelled event
         self.event_manager.emit(Event(
             name="command.cancelled",
-            data={"command_id": str(command_id)},
-            timestamp=datetime.now()
+            data={"command_id": str(command_id)}
         ))
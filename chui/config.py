@@ -381,6 +381,11 @@ class Config:
                 'enabled': [],
                 'disabled': [],
                 'auto_load': True,
+                'scan_directory': True,
+                'eager_load': True,
+            },
+            'events': {
+                'max_completed': 1024,
             },
             'debug': {  # New immutable debug flags section
                 'system': {
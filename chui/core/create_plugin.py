@@ -1,11 +1,16 @@
 # chui/core/create_plugin.py
 
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 from textwrap import dedent
 
+# Plugin name normalization and validation
+_NAME_TRANS = str.maketrans({' ': '_', '-': '_'})
+_VALID_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*\Z')
+
 
 class PluginCreator:
     """Plugin creation utility for Chui framework"""
@@ -16,28 +21,31 @@ class PluginCreator:
     def create(self, name: str, description: str = "", author: str = "") -> Path:
         """Create a new plugin from template"""
         # Sanitize plugin name
-        plugin_name = name.lower().replace(' ', '_').replace('-', '_')
+        plugin_name = name.lower().translate(_NAME_TRANS)
         plugin_dir = self.plugins_dir / plugin_name
 
         # Validate plugin name
-        if not self._validate_plugin_name(plugin_name):
+        if not _VALID_NAME.match(plugin_name):
             raise ValueError(
                 "Plugin name must be a valid Python identifier and not start with numbers"
             )
 
+        if plugin_name in self._existing_plugins():
+            raise ValueError(f"Plugin already exists: {plugin_dir}")
+
         # Create plugin structure
         self._ensure_plugins_dir()
         self._create_plugin_structure(plugin_name, plugin_dir, description, author)
 
         return plugin_dir
 
-    def _validate_plugin_name(self, name: str) -> bool:
-        """Validate plugin name is a valid Python identifier"""
-        if not name.isidentifier():
-            return False
-        if name[0].isdigit():
-            return False
-        return True
+    def _existing_plugins(self) -> Set[str]:
+        """Get names of plugin directories already in the plugins directory"""
+        try:
+            with os.scandir(self.plugins_dir) as entries:
+                return {entry.name for entry in entries if entry.is_dir(follow_symlinks=False)}
+        except FileNotFoundError:
+            return set()
 
     def _ensure_plugins_dir(self) -> None:
         """Ensure plugins directory exists"""
@@ -131,6 +139,9 @@ class PluginCreator:
                         "{name}": {name.title()}Command
                     }}
 
+            # Tells plugin discovery which class to load
+            PLUGIN_CLASS = {name.title()}Plugin
+
             def setup(cli: CLIProtocol) -> None:
                 """Register plugin with the CLI"""
                 try:
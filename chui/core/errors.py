@@ -2,12 +2,11 @@
 
 import traceback
 import logging
-from typing import Optional, Type, Dict, Any, Callable
+from types import MappingProxyType
+from typing import Optional, Type, Dict, Any, Callable, Tuple, Union
 from enum import Enum
 from datetime import datetime
 
-from rich.console import Console
-
 
 class ErrorSeverity(Enum):
     DEBUG = "DEBUG"
@@ -44,7 +43,16 @@ class ErrorContext:
         self.context = context or {}
         self.operation = operation
         self.timestamp = datetime.now()
-        self.traceback = traceback.format_exc() if error else None
+        self._tb: Optional[str] = None
+
+    @property
+    def traceback(self) -> Optional[str]:
+        """Formatted traceback of the error, built on first access"""
+        if self._tb is None and self.error is not None and self.error.__traceback__:
+            self._tb = ''.join(
+                traceback.TracebackException.from_exception(self.error).format()
+            )
+        return self._tb
 
 
 class ChuiError(Exception):
@@ -252,33 +260,92 @@ class EventError(ChuiError):
         super().__init__(message, context=context, **kwargs)
 
 
+# Default error messages: each entry maps an error type to the message
+# prefix shown to the user and an optional hint function that adds context
+def _config_hint(handler: 'ErrorHandler', context: ErrorContext) -> None:
+    if context.operation:
+        handler.ui.info(f"While performing: {context.operation}")
+    if handler.config:
+        handler.ui.info("Try resetting the affected configuration:")
+        handler.ui.info(f"  settings reset {context.context.get('setting', '')}")
+
+
+def _plugin_hint(handler: 'ErrorHandler', context: ErrorContext) -> None:
+    plugin_name = context.context.get('plugin_name')
+    if plugin_name:
+        handler.ui.info(f"Affected plugin: {plugin_name}")
+        handler.ui.info("Try: plugins reload <plugin_name>")
+
+
+def _command_hint(handler: 'ErrorHandler', context: ErrorContext) -> None:
+    cmd = context.context.get('command')
+    if cmd:
+        handler.ui.info(f"Failed command: {cmd}")
+        handler.ui.info("Try 'help <command>' for usage information")
+
+
+def _security_hint(handler: 'ErrorHandler', context: ErrorContext) -> None:
+    handler.logger.critical(f"Security violation: {context.error}")
+
+
+def _system_hint(handler: 'ErrorHandler', context: ErrorContext) -> None:
+    if context.context.get('needs_restart'):
+        handler.ui.warning("This error may require restarting the application")
+
+
+def _file_hint(handler: 'ErrorHandler', context: ErrorContext) -> None:
+    path = context.context.get('path')
+    if path:
+        handler.ui.info(f"Affected path: {path}")
+
+
+def _permission_hint(handler: 'ErrorHandler', context: ErrorContext) -> None:
+    if context.context.get('needs_elevation'):
+        handler.ui.info("This operation may require elevated privileges")
+
+
+_HANDLER_TABLE: Dict[Type[Exception], Tuple[str, Optional[Callable]]] = {
+    ConfigError: ("Configuration error", _config_hint),
+    PluginError: ("Plugin error", _plugin_hint),
+    CommandError: ("Command error", _command_hint),
+    SecurityError: ("Security error", _security_hint),
+    SystemError: ("System error", _system_hint),
+    FileNotFoundError: ("File error", _file_hint),
+    PermissionError: ("Permission denied", _permission_hint),
+}
+
+_GENERIC_HANDLER: Tuple[str, Optional[Callable]] = ("Error", None)
+
+
 class ErrorHandler:
     """Centralized error handling with enhanced logging and context"""
 
+    _DEFAULT_HANDLERS = MappingProxyType(_HANDLER_TABLE)
+
     def __init__(self, ui, config=None):
         self.ui = ui
         self.config = config
-        self.console = Console(stderr=True)
+        self._console = None
         self.logger = logging.getLogger('chui.errors')
 
-        # Error type mappings with custom handlers
-        self._handlers: Dict[Type[Exception], Callable] = {}
-        self._register_default_handlers()
+        # Error type mappings: (prefix, hint) table entries or custom handlers.
+        # Shares the read-only defaults until a custom handler is registered.
+        self._handlers = self._DEFAULT_HANDLERS
 
-    def _register_default_handlers(self) -> None:
-        """Register default error handlers"""
-        self.register_handler(ConfigError, self._handle_config_error)
-        self.register_handler(PluginError, self._handle_plugin_error)
-        self.register_handler(CommandError, self._handle_command_error)
-        self.register_handler(SecurityError, self._handle_security_error)
-        self.register_handler(SystemError, self._handle_system_error)
-        self.register_handler(FileNotFoundError, self._handle_file_error)
-        self.register_handler(PermissionError, self._handle_permission_error)
+    @property
+    def console(self):
+        """Stderr console, created on first use"""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console(stderr=True)
+        return self._console
 
     def register_handler(self,
                          error_type: Type[Exception],
                          handler: Callable) -> None:
         """Register a custom error handler"""
+        if self._handlers is self._DEFAULT_HANDLERS:
+            self._handlers = dict(self._DEFAULT_HANDLERS)
         self._handlers[error_type] = handler
 
     def handle(self,
@@ -305,22 +372,38 @@ class ErrorHandler:
 
         # Find and execute appropriate handler
         handler = self._get_handler(type(error))
-        handler(error_ctx)
+        if isinstance(handler, tuple):
+            prefix, hint = handler
+            self._emit(error_ctx, prefix, hint)
+        else:
+            handler(error_ctx)
 
         # Display debug information if requested
         if debug and error_ctx.traceback:
             self.ui.debug("Traceback:")
             self.ui.debug(error_ctx.traceback)
 
-    def _get_handler(self, error_type: Type[Exception]) -> Callable:
+    def _get_handler(self, error_type: Type[Exception]) -> Union[Tuple[str, Optional[Callable]], Callable]:
         """Get appropriate handler for error type"""
-        for err_type, handler in self._handlers.items():
-            if issubclass(error_type, err_type):
+        # Walk the MRO so the most specific registered handler wins
+        for cls in error_type.__mro__:
+            handler = self._handlers.get(cls)
+            if handler is not None:
                 return handler
-        return self._handle_generic_error
+        return _GENERIC_HANDLER
+
+    def _emit(self, context: ErrorContext, prefix: str, hint: Optional[Callable]) -> None:
+        """Display a default error message followed by its hint"""
+        self.ui.error(f"{prefix}: {context.error}")
+        if hint is not None:
+            hint(self, context)
 
     def _log_error(self, context: ErrorContext) -> None:
         """Log error with full context"""
+        level_name = context.severity.value if hasattr(context.severity, 'value') else 'ERROR'
+        if not self.logger.isEnabledFor(getattr(logging, level_name, logging.ERROR)):
+            return
+
         error_dict = {
             'timestamp': context.timestamp.isoformat(),
             'category': context.category.value if hasattr(context.category, 'value') else str(context.category),
@@ -339,57 +422,3 @@ class ErrorHandler:
             self.logger.error
         )
         log_method(error_dict)
-
-    # Default error handlers
-    def _handle_config_error(self, context: ErrorContext) -> None:
-        """Handle configuration errors"""
-        self.ui.error(f"Configuration error: {context.error}")
-        if context.operation:
-            self.ui.info(f"While performing: {context.operation}")
-        if self.config:
-            self.ui.info("Try resetting the affected configuration:")
-            self.ui.info(f"  settings reset {context.context.get('setting', '')}")
-
-    def _handle_plugin_error(self, context: ErrorContext) -> None:
-        """Handle plugin-related errors"""
-        self.ui.error(f"Plugin error: {context.error}")
-        plugin_name = context.context.get('plugin_name')
-        if plugin_name:
-            self.ui.info(f"Affected plugin: {plugin_name}")
-            self.ui.info("Try: plugins reload <plugin_name>")
-
-    def _handle_command_error(self, context: ErrorContext) -> None:
-        """Handle command execution errors"""
-        self.ui.error(f"Command error: {context.error}")
-        cmd = context.context.get('command')
-        if cmd:
-            self.ui.info(f"Failed command: {cmd}")
-            self.ui.info("Try 'help <command>' for usage information")
-
-    def _handle_security_error(self, context: ErrorContext) -> None:
-        """Handle security-related errors"""
-        self.ui.error(f"Security error: {context.error}")
-        self.logger.critical(f"Security violation: {context.error}")
-
-    def _handle_system_error(self, context: ErrorContext) -> None:
-        """Handle system-related errors"""
-        self.ui.error(f"System error: {context.error}")
-        if context.context.get('needs_restart'):
-            self.ui.warning("This error may require restarting the application")
-
-    def _handle_file_error(self, context: ErrorContext) -> None:
-        """Handle file-related errors"""
-        self.ui.error(f"File error: {context.error}")
-        path = context.context.get('path')
-        if path:
-            self.ui.info(f"Affected path: {path}")
-
-    def _handle_permission_error(self, context: ErrorContext) -> None:
-        """Handle permission-related errors"""
-        self.ui.error(f"Permission denied: {context.error}")
-        if context.context.get('needs_elevation'):
-            self.ui.info("This operation may require elevated privileges")
-
-    def _handle_generic_error(self, context: ErrorContext) -> None:
-        """Handle any unrecognized error"""
-        self.ui.error(f"Error: {context.error}")
\ No newline at end of file
@@ -1,6 +1,6 @@
 # chui/events/__init__.py
 
-from .base import Event, EventManager, OperationContext
+from .base import Event, EventManager, EventRecord, OperationContext
 from .types import InfraEventType
 
-__all__ = ['Event', 'EventManager', 'OperationContext', 'InfraEventType']
\ No newline at end of file
+__all__ = ['Event', 'EventManager', 'EventRecord', 'OperationContext', 'InfraEventType']
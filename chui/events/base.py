@@ -1,25 +1,93 @@
 # chui/events/base.py
 
-from typing import Callable, Dict, List, Any, TypeVar, Generic, Optional
+import builtins
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, List, Any, TypeVar, Generic, Optional, Tuple, Sequence, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID, uuid4
 
+from chui._compat import DATACLASS_SLOTS
 from chui.core.errors import EventError
+from .types import InfraEventType
 
 T = TypeVar('T')
 
-@dataclass
+# Aggregates multiple handler failures where supported (Python 3.11+)
+_ExceptionGroup = getattr(builtins, 'ExceptionGroup', None)
+
+# Offset from the monotonic clock to wall-clock time, for display only
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _wall_clock(timestamp_ns: int) -> datetime:
+    """Convert a monotonic_ns timestamp to a wall-clock datetime"""
+    return datetime.fromtimestamp((timestamp_ns + _WALL_OFFSET_NS) / 1e9)
+
+
+def event_key(name: Union[str, InfraEventType]) -> str:
+    """Normalize an event name to the interned string used as a handler key"""
+    if isinstance(name, InfraEventType):
+        return name.value
+    return sys.intern(name)
+
+
+@dataclass(init=False, **DATACLASS_SLOTS)
 class Event(Generic[T]):
-    """Base event class for all system events"""
-    name: str
+    """Base event class for all system events
+
+    Events are stamped with time.monotonic_ns(); the wall-clock timestamp is
+    only built when read, unless one is passed explicitly.
+    """
+    name: Union[str, InfraEventType]
     data: T
-    timestamp: datetime
     operation_id: Optional[UUID] = None
     source: Optional[str] = None
+    timestamp_ns: int = 0
+    _timestamp: Optional[datetime] = field(default=None, repr=False, compare=False)
+
+    def __init__(self, name: Union[str, InfraEventType], data: T,
+                 timestamp: Optional[datetime] = None,
+                 operation_id: Optional[UUID] = None,
+                 source: Optional[str] = None,
+                 timestamp_ns: Optional[int] = None):
+        self.name = name
+        self.data = data
+        self.operation_id = operation_id
+        self.source = source
+        self.timestamp_ns = time.monotonic_ns() if timestamp_ns is None else timestamp_ns
+        self._timestamp = timestamp
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time of the event"""
+        if self._timestamp is None:
+            self._timestamp = _wall_clock(self.timestamp_ns)
+        return self._timestamp
 
 
-@dataclass
+class EventRecord:
+    """Lightweight timeline entry for an event within an operation"""
+    __slots__ = ('timestamp_ns', 'name', 'data')
+
+    def __init__(self, timestamp_ns: int, name: str, data: Any):
+        self.timestamp_ns = timestamp_ns
+        self.name = name
+        self.data = data
+
+    @property
+    def timestamp(self) -> datetime:
+        """Wall-clock time of the event"""
+        return _wall_clock(self.timestamp_ns)
+
+    def __repr__(self) -> str:
+        return f"EventRecord(timestamp_ns={self.timestamp_ns!r}, name={self.name!r}, data={self.data!r})"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OperationContext:
     """Tracks context of an operation across multiple events"""
     operation_id: UUID
@@ -27,17 +95,26 @@ class OperationContext:
     start_time: datetime
     status: str = "in_progress"
     metadata: Dict = field(default_factory=dict)
-    events: List[Dict] = field(default_factory=list)
+    events: List[EventRecord] = field(default_factory=list)
     end_time: Optional[datetime] = None
     error: Optional[str] = None
 
     def add_event(self, event: Event) -> None:
-        """Add an event to the operation timeline"""
-        self.events.append({
-            "timestamp": event.timestamp,
-            "name": event.name,
-            "data": event.data
-        })
+        """Add an event to the operation timeline
+
+        Keeps events ordered by timestamp so the timeline never needs sorting.
+        """
+        record = EventRecord(event.timestamp_ns, event.name, event.data)
+        events = self.events
+        if not events or events[-1].timestamp_ns <= record.timestamp_ns:
+            events.append(record)
+            return
+
+        # Late arrival: walk back to its slot (usually only a few entries)
+        index = len(events) - 1
+        while index > 0 and events[index - 1].timestamp_ns > record.timestamp_ns:
+            index -= 1
+        events.insert(index, record)
 
     def complete(self, status: str = "completed", error: Optional[str] = None) -> None:
         """Mark operation as complete"""
@@ -46,61 +123,192 @@ class OperationContext:
         self.error = error
 
 
+
+class _TrieNode:
+    """Node in the dot-segmented trie of wildcard subscriptions"""
+    __slots__ = ('subscribers', 'handlers', 'children')
+
+    def __init__(self):
+        self.subscribers: Dict[Callable, None] = {}
+        self.handlers: Tuple[Callable, ...] = ()
+        self.children: Dict[str, '_TrieNode'] = {}
+
+
 class EventManager:
     """Central event management system"""
 
-    def __init__(self):
-        self._handlers: Dict[str, List[Callable]] = {}
-        self._wildcard_handlers: List[Callable] = []
+    def __init__(self, max_completed: int = 1024):
+        # Subscribers are kept in insertion-ordered dicts keyed by handler for
+        # O(1) unsubscribe; emit reads the tuple snapshots in _handlers, which
+        # are replaced (never mutated) under the write lock
+        self._subscribers: Dict[str, Dict[Callable, None]] = {}
+        self._handlers: Dict[str, Tuple[Callable, ...]] = {}
+        # Patterns such as "*" or "deploy.*"; a trailing "*" matches one or
+        # more remaining segments, an inner "*" matches exactly one
+        self._wildcards = _TrieNode()
+        self._write_lock = threading.Lock()
+        # Per-event-name tuple of specific + wildcard handlers, rebuilt lazily
+        self._dispatch_cache: Dict[Any, Tuple[Callable, ...]] = {}
         self._active_operations: Dict[UUID, OperationContext] = {}
-        self._completed_operations: Dict[UUID, OperationContext] = {}
+        # Oldest completed operations are evicted beyond max_completed
+        self.max_completed = max_completed
+        self._completed_operations: 'OrderedDict[UUID, OperationContext]' = OrderedDict()
 
-    def subscribe(self, event_name: str, handler: Callable) -> None:
+    def subscribe(self, event_name: Union[str, InfraEventType], handler: Callable) -> None:
         """Subscribe to an event"""
-        if event_name == "*":
-            self._wildcard_handlers.append(handler)
-        else:
-            if event_name not in self._handlers:
-                self._handlers[event_name] = []
-            self._handlers[event_name].append(handler)
-
-    def unsubscribe(self, event_name: str, handler: Callable) -> None:
-        """Unsubscribe from an event"""
-        if event_name == "*":
-            self._wildcard_handlers.remove(handler)
-        else:
-            self._handlers[event_name].remove(handler)
+        event_name = event_key(event_name)
+        with self._write_lock:
+            if "*" in event_name:
+                node = self._wildcard_node(event_name, create=True)
+                node.subscribers[handler] = None
+                node.handlers = tuple(node.subscribers)
+            else:
+                subscribers = self._subscribers.setdefault(event_name, {})
+                subscribers[handler] = None
+                self._handlers[event_name] = tuple(subscribers)
+            self._dispatch_cache = {}
+
+    def unsubscribe(self, event_name: Union[str, InfraEventType], handler: Callable) -> None:
+        """Unsubscribe from an event; unknown handlers are ignored"""
+        event_name = event_key(event_name)
+        with self._write_lock:
+            if "*" in event_name:
+                node = self._wildcard_node(event_name, create=False)
+                if node is None:
+                    return
+                node.subscribers.pop(handler, None)
+                node.handlers = tuple(node.subscribers)
+            else:
+                subscribers = self._subscribers.get(event_name)
+                if subscribers is None:
+                    return
+                subscribers.pop(handler, None)
+                self._handlers[event_name] = tuple(subscribers)
+            self._dispatch_cache = {}
+
+    def _wildcard_node(self, pattern: str, create: bool) -> Optional[_TrieNode]:
+        """Find (or create) the trie node for a wildcard pattern"""
+        node = self._wildcards
+        for segment in pattern.split('.'):
+            child = node.children.get(segment)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[segment] = _TrieNode()
+            node = child
+        return node
+
+    def _match_wildcards(self, node: _TrieNode, segments: List[str], index: int,
+                         matched: List[Callable]) -> None:
+        """Collect handlers of all patterns matching segments[index:]"""
+        if index == len(segments):
+            matched.extend(node.handlers)
+            return
+        child = node.children.get(segments[index])
+        if child is not None:
+            self._match_wildcards(child, segments, index + 1, matched)
+        star = node.children.get("*")
+        if star is not None:
+            # A pattern ending in "*" swallows the rest of the name
+            matched.extend(star.handlers)
+            # An inner "*" consumes exactly one segment
+            if star.children and index + 1 < len(segments):
+                self._match_wildcards(star, segments, index + 1, matched)
 
     def emit(self, event: Event) -> None:
-        """Emit an event"""
-        # Add event to operation context if it exists
-        if event.operation_id and event.operation_id in self._active_operations:
-            self._active_operations[event.operation_id].add_event(event)
+        """Emit an event
 
-        # Call specific handlers
-        for handler in self._handlers.get(event.name, []):
-            try:
-                handler(event)
-            except Exception as e:
-                raise EventError(f"Error in event handler: {str(e)}", e)
+        Every handler runs even if an earlier one fails; failures are raised
+        together as a single EventError afterwards.
+        """
+        # Add event to operation context if it exists (usually none are active)
+        active = self._active_operations
+        if active and event.operation_id and event.operation_id in active:
+            active[event.operation_id].add_event(event)
 
-        # Call wildcard handlers
-        for handler in self._wildcard_handlers:
+        # Call specific handlers, then wildcard handlers
+        cache = self._dispatch_cache
+        handlers = cache.get(event.name)
+        if handlers is None:
+            handlers = self._get_dispatch(cache, event.name)
+        errors = None
+        for handler in handlers:
             try:
                 handler(event)
             except Exception as e:
-                raise EventError(f"Error in wildcard handler: {str(e)}", e)
+                if errors is None:
+                    errors = []
+                errors.append(e)
+        if errors:
+            self._raise_handler_errors(event.name, errors)
+
+    def emit_many(self, events: Sequence[Event]) -> None:
+        """Emit a batch of events, resolving handlers once per event name
+
+        Events are dispatched grouped by name, in order of first appearance.
+        """
+        by_name: Dict[Any, List[Event]] = defaultdict(list)
+        active = self._active_operations
+        for event in events:
+            by_name[event.name].append(event)
+            if active and event.operation_id and event.operation_id in active:
+                active[event.operation_id].add_event(event)
+
+        errors = None
+        cache = self._dispatch_cache
+        for name, batch in by_name.items():
+            handlers = cache.get(name)
+            if handlers is None:
+                handlers = self._get_dispatch(cache, name)
+            if not handlers:
+                continue
+            for event in batch:
+                for handler in handlers:
+                    try:
+                        handler(event)
+                    except Exception as e:
+                        if errors is None:
+                            errors = []
+                        errors.append(e)
+        if errors:
+            self._raise_handler_errors(None, errors)
+
+    @staticmethod
+    def _raise_handler_errors(event_name: Any, errors: List[Exception]) -> None:
+        """Raise one EventError for the handler failures collected during dispatch"""
+        event_type = event_key(event_name) if event_name is not None else None
+        if len(errors) == 1:
+            raise EventError(f"Error in event handler: {errors[0]}",
+                             event_type=event_type, original_error=errors[0]) from errors[0]
+
+        cause = errors[0]
+        if _ExceptionGroup is not None:
+            cause = _ExceptionGroup("event handler failures", errors)
+        raise EventError(f"{len(errors)} event handlers failed: {errors[0]}",
+                         event_type=event_type, original_error=cause) from cause
+
+    def _get_dispatch(self, cache: Dict[Any, Tuple[Callable, ...]],
+                      event_name: Union[str, InfraEventType]) -> Tuple[Callable, ...]:
+        """Build and cache the handler tuple for an event name"""
+        # Stored into the cache snapshot the caller read, so a concurrent
+        # subscribe (which swaps in a fresh cache) discards stale entries.
+        # Cached under the name as emitted; enum and string forms share handlers.
+        key = event_key(event_name)
+        matched: List[Callable] = []
+        self._match_wildcards(self._wildcards, key.split('.'), 0, matched)
+        handlers = self._handlers.get(key, ()) + tuple(matched)
+        cache[event_name] = handlers
+        return handlers
 
     def start_operation(self, operation_type: str, metadata: Dict = None) -> UUID:
         """Start a new operation and get its correlation ID"""
         operation_id = uuid4()
-        context = OperationContext(
+        self._active_operations[operation_id] = OperationContext(
             operation_id=operation_id,
             operation_type=operation_type,
             start_time=datetime.now(),
             metadata=metadata or {}
         )
-        self._active_operations[operation_id] = context
         return operation_id
 
     def complete_operation(self, operation_id: UUID, status: str = "completed", error: str = None) -> None:
@@ -110,7 +318,16 @@ class EventManager:
 
         context = self._active_operations.pop(operation_id)
         context.complete(status, error)
-        self._completed_operations[operation_id] = context
+        completed = self._completed_operations
+        completed[operation_id] = context
+        while len(completed) > self.max_completed:
+            completed.popitem(last=False)
+
+    def compact(self, operation_id: UUID) -> None:
+        """Drop a completed operation's event timeline, keeping status and timing"""
+        context = self._completed_operations.get(operation_id)
+        if context:
+            context.events = []
 
     def get_operation_status(self, operation_id: UUID) -> Optional[OperationContext]:
         """Get the current status of an operation"""
@@ -119,12 +336,12 @@ class EventManager:
             self._completed_operations.get(operation_id)
         )
 
-    def get_operation_timeline(self, operation_id: UUID) -> List[Dict]:
+    def get_operation_timeline(self, operation_id: UUID) -> List[EventRecord]:
         """Get chronological timeline of operation events"""
         context = self.get_operation_status(operation_id)
         if not context:
             return []
-        return sorted(context.events, key=lambda e: e["timestamp"])
+        return list(context.events)
 
     def get_active_operations(self) -> Dict[UUID, OperationContext]:
         """Get all currently active operations"""
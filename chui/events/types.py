@@ -5,6 +5,8 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+from chui._compat import DATACLASS_SLOTS
+
 
 class InfraEventType(Enum):
     # Host Events
@@ -35,7 +37,7 @@ class InfraEventType(Enum):
     SERVICE_HEALTH_CHECK = "service.health_check"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HostEventData:
     host: str
     port: int
@@ -43,7 +45,7 @@ class HostEventData:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DeployEventData:
     deployment_id: str
     target_hosts: list[str]
@@ -54,7 +56,7 @@ class DeployEventData:
     progress: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CommandEventData:
     command_id: str
     command: str
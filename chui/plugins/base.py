@@ -1,7 +1,9 @@
 # chui/plugins/base.py
 
+import logging
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 from datetime import datetime
 
 from ..core.errors import PluginError, ErrorCategory
@@ -9,6 +11,42 @@ from ..events.base import Event, EventManager
 from ..config import Config
 from ..ui import UI
 
+logger = logging.getLogger('chui.plugins')
+
+
+class _UIDebugHandler(logging.Handler):
+    """Forward plugin log records to a UI, at the matching UI message level"""
+
+    def __init__(self, ui: UI):
+        super().__init__(logging.DEBUG)
+        self.ui = ui
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.ERROR:
+                show = self.ui.error
+            elif record.levelno >= logging.WARNING:
+                show = self.ui.warning
+            elif record.levelno >= logging.INFO:
+                show = self.ui.info
+            else:
+                show = self.ui.debug
+            show(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+def route_debug_to_ui(ui: UI, propagate: bool = True) -> None:
+    """Show plugin log output through the UI; safe to call more than once
+
+    Which records are shown is decided by each plugin's own logger level.
+    Pass propagate=False when the root logger also writes to the terminal,
+    so records aren't shown twice.
+    """
+    if not any(isinstance(h, _UIDebugHandler) and h.ui is ui for h in logger.handlers):
+        logger.addHandler(_UIDebugHandler(ui))
+    logger.propagate = propagate
+
 
 class Plugin(ABC):
     """Base class for all Chui plugins
@@ -38,10 +76,16 @@ class Plugin(ABC):
         self.events = events
         self.initialized = False
         self.debug = config.get('system.debug', False)
+        self._logger: Optional[logging.Logger] = None
 
         # Store initialization time
         self._init_time = datetime.now()
 
+        # "<plugin>." prefix (set on first emit, since name is abstract) and
+        # short event name -> interned "<plugin>.<name>" event name
+        self._event_prefix: Optional[str] = None
+        self._event_name_cache: Dict[str, str] = {}
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -68,6 +112,19 @@ class Plugin(ABC):
         """
         return []
 
+    @property
+    def logger(self) -> logging.Logger:
+        """This plugin's logger, a child of chui.plugins at its own debug level"""
+        if self._logger is None:
+            self._logger = logging.getLogger(f'{logger.name}.{self.name}')
+            self._logger.setLevel(logging.DEBUG if self.debug else logging.INFO)
+        return self._logger
+
+    @logger.setter
+    def logger(self, value: logging.Logger) -> None:
+        """Let subclasses that assign self.logger keep working"""
+        self._logger = value
+
     @property
     def initialized_time(self) -> Optional[datetime]:
         """Get the time when plugin was initialized
@@ -87,8 +144,7 @@ class Plugin(ABC):
             PluginError: If initialization fails
         """
         try:
-            if self.debug:
-                self.ui.debug(f"Initializing plugin: {self.name}")
+            self.logger.debug("Initializing plugin: %s", self.name)
 
             # Perform initialization
             self._initialize()
@@ -97,8 +153,7 @@ class Plugin(ABC):
             self.initialized = True
             self._init_time = datetime.now()
 
-            if self.debug:
-                self.ui.debug(f"Plugin {self.name} initialized successfully")
+            self.logger.debug("Plugin %s initialized successfully", self.name)
 
         except Exception as e:
             raise PluginError(f"Failed to initialize plugin {self.name}: {str(e)}")
@@ -118,8 +173,7 @@ class Plugin(ABC):
         any required cleanup.
         """
         try:
-            if self.debug:
-                self.ui.debug(f"Cleaning up plugin: {self.name}")
+            self.logger.debug("Cleaning up plugin: %s", self.name)
 
             # Perform cleanup
             self._cleanup()
@@ -127,8 +181,7 @@ class Plugin(ABC):
             # Reset initialization flag
             self.initialized = False
 
-            if self.debug:
-                self.ui.debug(f"Plugin {self.name} cleaned up successfully")
+            self.logger.debug("Plugin %s cleaned up successfully", self.name)
 
         except Exception as e:
             self.ui.error(f"Error cleaning up plugin {self.name}: {str(e)}")
@@ -157,6 +210,16 @@ class Plugin(ABC):
         """
         return {}
 
+    def _event_name(self, name: str) -> str:
+        """Get the namespaced event name for a plugin event"""
+        event_name = self._event_name_cache.get(name)
+        if event_name is None:
+            if self._event_prefix is None:
+                self._event_prefix = f"{self.name}."
+            event_name = sys.intern(self._event_prefix + name)
+            self._event_name_cache[name] = event_name
+        return event_name
+
     def emit_event(self, name: str, data: Any = None) -> None:
         """Emit a plugin-specific event
 
@@ -166,13 +229,24 @@ class Plugin(ABC):
         """
         try:
             self.events.emit(Event(
-                name=f"{self.name}.{name}",
-                data=data,
-                timestamp=datetime.now()
+                name=self._event_name(name),
+                data=data
             ))
         except Exception as e:
-            if self.debug:
-                self.ui.debug(f"Error emitting event {name}: {str(e)}")
+            self.logger.debug("Error emitting event %s: %s", name, e)
+
+    def emit_event_many(self, name: str, items: Iterable[Any]) -> None:
+        """Emit one plugin-specific event per item in a single batch
+
+        Args:
+            name: Event name
+            items: Event data for each event
+        """
+        event_name = self._event_name(name)
+        try:
+            self.events.emit_many([Event(name=event_name, data=data) for data in items])
+        except Exception as e:
+            self.logger.debug("Error emitting events %s: %s", name, e)
 
     def __str__(self) -> str:
         """String representation of plugin"""
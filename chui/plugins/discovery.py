@@ -1,10 +1,14 @@
 # chui/plugins/discovery.py
 
 import importlib
+import importlib.machinery
+import importlib.metadata
+import importlib.util
+import json
 import pkgutil
-import os
+import sys
 from pathlib import Path
-from typing import Dict, Type, Iterator, Optional
+from typing import Dict, Type, Iterator, Optional, Any, Callable
 from ..core.errors import PluginError, ErrorCategory
 from .base import Plugin
 from ..ui import UI
@@ -14,6 +18,11 @@ from ..config import Config
 class PluginDiscovery:
     """Dynamic plugin discovery and loading system"""
 
+    CACHE_FILE = 'plugin_discovery.json'
+    ENTRY_POINT_GROUP = 'chui.plugins'
+    # Directory plugins are imported as subpackages <name>.<dir name>
+    PACKAGE_NAME = 'plugins'
+
     def __init__(self, ui: UI, config: Config):
         self.ui = ui
         self.config = config
@@ -59,68 +68,209 @@ class PluginDiscovery:
             except Exception as e:
                 self.ui.error(f"Error creating plugins directory: {str(e)}")
 
-        # Add plugins directory parent to Python path if not already there
-        plugins_parent = str(self.plugins_dir.parent)
-        if plugins_parent not in os.sys.path:
-            if self.debug:
-                self.ui.debug(f"Adding {plugins_parent} to Python path")
-            os.sys.path.insert(0, plugins_parent)
-
     def discover_plugins(self) -> Dict[str, Type[Plugin]]:
-        """Discover all available plugins in the plugins directory"""
-        if self.debug:
-            self.ui.debug("Starting plugin discovery...")
+        """Discover plugins from package entry points and the plugins directory"""
+        # Bound once so the per-directory checks below skip message formatting
+        dbg = self.ui.debug if self.debug else None
+        if dbg:
+            dbg("Starting plugin discovery...")
         plugins = {}
 
+        # Installed packages declaring [project.entry-points."chui.plugins"]
+        self._discover_entry_points(plugins, dbg)
+
+        if self.config.get('plugins.scan_directory', True):
+            self._discover_directory(plugins, dbg)
+
+        if dbg:
+            dbg(f"Plugin discovery completed. Found plugins: {list(plugins.keys())}")
+        return plugins
+
+    def _discover_entry_points(self, plugins: Dict[Any, Type[Plugin]], dbg: Optional[Callable]) -> None:
+        """Load plugin classes registered as package entry points"""
+        try:
+            eps = importlib.metadata.entry_points()
+            if hasattr(eps, 'select'):
+                eps = eps.select(group=self.ENTRY_POINT_GROUP)
+            else:
+                # Python < 3.10 returns a dict of groups
+                eps = eps.get(self.ENTRY_POINT_GROUP, ())
+        except Exception as e:
+            self.ui.error(f"Error reading plugin entry points: {str(e)}")
+            return
+
+        for ep in eps:
+            try:
+                plugins[ep.name] = ep.load()
+                if dbg:
+                    dbg(f"Found plugin entry point: {ep.name} ({ep.value})")
+            except Exception as e:
+                self.ui.error(f"Error loading plugin {ep.name}: {str(e)}")
+
+    def _discover_directory(self, plugins: Dict[Any, Type[Plugin]], dbg: Optional[Callable]) -> None:
+        """Import plugin packages from the plugins directory"""
         try:
             if not self.plugins_dir.exists():
                 self.ui.warning(f"Plugins directory not found: {self.plugins_dir}")
-                return plugins
+                return
 
-            if self.debug:
-                self.ui.debug(f"Scanning plugins directory: {self.plugins_dir}")
+            if dbg:
+                dbg(f"Scanning plugins directory: {self.plugins_dir}")
+
+            cache = self._load_cache()
+            new_cache: Dict[str, Any] = {}
 
             # Look for plugin directories
             for plugin_dir in self.plugins_dir.iterdir():
-                if self.debug:
-                    self.ui.debug(f"Checking directory: {plugin_dir}")
+                if dbg:
+                    dbg(f"Checking directory: {plugin_dir}")
 
                 if not plugin_dir.is_dir() or plugin_dir.name.startswith('_'):
                     continue
 
                 try:
                     # Import the plugin module
-                    module_name = f"plugins.{plugin_dir.name}.plugin"
-                    if self.debug:
-                        self.ui.debug(f"Attempting to import module: {module_name}")
+                    module_name = f"{self.PACKAGE_NAME}.{plugin_dir.name}.plugin"
+                    if dbg:
+                        dbg(f"Attempting to import module: {module_name}")
 
-                    module = importlib.import_module(module_name)
-                    if self.debug:
-                        self.ui.debug(f"Successfully imported module: {module_name}")
-
-                    # Look for Plugin class in module
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (isinstance(attr, type) and
-                                issubclass(attr, Plugin) and
-                                attr != Plugin):
-                            # Found a plugin class
-                            plugin_class = attr
-                            plugin_name = getattr(plugin_class, 'name', plugin_dir.name)
-                            plugins[plugin_name] = plugin_class
-                            if self.debug:
-                                self.ui.debug(f"Found plugin class: {plugin_name}")
+                    # Decided before importing: a plugin unchanged since the
+                    # last run only needs its recorded attributes looked up
+                    mtime = self._plugin_mtime(plugin_dir)
+                    cached = cache.get(plugin_dir.name)
+                    cached_names = None
+                    if cached and cached[0] == mtime and cached[1] == module_name:
+                        cached_names = cached[2]
+
+                    module = self._import_plugin_module(plugin_dir)
+                    if dbg:
+                        dbg(f"Successfully imported module: {module_name}")
+
+                    classes = None
+                    if cached_names is not None:
+                        try:
+                            classes = {attr_name: getattr(module, attr_name) for attr_name in cached_names}
+                        except AttributeError:
+                            classes = None
+                    if classes is None:
+                        plugin_class = getattr(module, 'PLUGIN_CLASS', None)
+                        if plugin_class is not None:
+                            classes = {'PLUGIN_CLASS': plugin_class}
+                        else:
+                            # Legacy plugin without PLUGIN_CLASS: scan the module
+                            classes = self._find_plugin_classes(module)
+                    new_cache[plugin_dir.name] = [mtime, module_name, list(classes)]
+
+                    for plugin_class in classes.values():
+                        # Found a plugin class
+                        plugin_name = getattr(plugin_class, 'name', plugin_dir.name)
+                        plugins[plugin_name] = plugin_class
+                        if dbg:
+                            dbg(f"Found plugin class: {plugin_name}")
 
                 except Exception as e:
                     self.ui.error(f"Error loading plugin {plugin_dir.name}: {str(e)}")
                     continue
 
+            if new_cache != cache:
+                self._save_cache(new_cache)
+
         except Exception as e:
             self.ui.error(f"Error during plugin discovery: {str(e)}")
 
-        if self.debug:
-            self.ui.debug(f"Plugin discovery completed. Found plugins: {list(plugins.keys())}")
-        return plugins
+    def _import_plugin_module(self, plugin_dir: Path) -> Any:
+        """Import <plugin_dir>/plugin.py as plugins.<dir name>.plugin
+
+        Plugins keep their historical module names, so relative imports and
+        absolute ones such as ``from plugins.<dir> import ...`` work, but the
+        plugins directory is added to the ``plugins`` package's search path
+        rather than its parent being put on sys.path.
+        """
+        self._plugins_package()
+        return importlib.import_module(f"{self.PACKAGE_NAME}.{plugin_dir.name}.plugin")
+
+    def _plugins_package(self) -> Any:
+        """Get the ``plugins`` package, making sure it searches plugins_dir"""
+        plugins_path = str(self.plugins_dir)
+        package = sys.modules.get(self.PACKAGE_NAME)
+        if package is None:
+            init_path = self.plugins_dir / '__init__.py'
+            if init_path.exists():
+                spec = importlib.util.spec_from_file_location(
+                    self.PACKAGE_NAME, init_path,
+                    submodule_search_locations=[plugins_path]
+                )
+            else:
+                spec = importlib.machinery.ModuleSpec(self.PACKAGE_NAME, None, is_package=True)
+                spec.submodule_search_locations = [plugins_path]
+
+            package = importlib.util.module_from_spec(spec)
+            sys.modules[self.PACKAGE_NAME] = package
+            try:
+                if spec.loader:
+                    spec.loader.exec_module(package)
+            except BaseException:
+                del sys.modules[self.PACKAGE_NAME]
+                raise
+
+        # An already imported plugins package (e.g. a project's own) also
+        # searches the configured directory
+        search_path = getattr(package, '__path__', None)
+        if search_path is not None and plugins_path not in search_path:
+            search_path.append(plugins_path)
+        return package
+
+    @staticmethod
+    def _find_plugin_classes(module: Any) -> Dict[str, Type[Plugin]]:
+        """Scan a module for Plugin subclasses, keyed by attribute name"""
+        classes = {}
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (isinstance(attr, type) and
+                    issubclass(attr, Plugin) and
+                    attr != Plugin):
+                classes[attr_name] = attr
+        return classes
+
+    @staticmethod
+    def _plugin_mtime(plugin_dir: Path) -> Optional[int]:
+        """Get the modification time of a plugin's module file"""
+        try:
+            return (plugin_dir / 'plugin.py').stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _cache_path(self) -> Path:
+        """Discovery cache location, in the user cache directory"""
+        return self.config.path_manager.get_cache_file(self.CACHE_FILE)
+
+    def _read_cache_file(self) -> Dict[str, Any]:
+        """Read the whole cache file, ignoring a missing or corrupt file"""
+        try:
+            with open(self._cache_path()) as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load the discovery cache for this plugins directory"""
+        cache = self._read_cache_file().get(str(self.plugins_dir))
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        """Persist the discovery cache for this plugins directory"""
+        # One file holds the caches of every plugins directory used
+        caches = self._read_cache_file()
+        caches[str(self.plugins_dir)] = cache
+        try:
+            path = self._cache_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(caches, f)
+        except OSError as e:
+            if self.debug:
+                self.ui.debug(f"Could not write discovery cache: {str(e)}")
 
     def get_plugin_path(self) -> Path:
         """Get the user plugins directory path"""
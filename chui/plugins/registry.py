@@ -1,8 +1,10 @@
 # chui/plugins/registry.py
 
-from typing import Dict, Type, Optional, List
+import inspect
+from collections import defaultdict, deque
+from functools import partial
+from typing import Dict, Type, Optional, List, Tuple, Set
 from pathlib import Path
-from datetime import datetime
 from ..commands import BaseCommand
 from .base import Plugin
 from .discovery import PluginDiscovery
@@ -12,6 +14,17 @@ from ..protocols import CLIProtocol
 from ..ui import UI
 from ..config import Config
 
+# Resolved once; the home directory does not change during a session
+_HOME = str(Path.home())
+
+
+def _expand(path: str) -> str:
+    """Expand a leading ~ using the cached home directory"""
+    if path == '~' or path.startswith(('~/', '~\\')):
+        return _HOME + path[1:]
+    # ~user forms still need a lookup
+    return str(Path(path).expanduser()) if path.startswith('~') else path
+
 
 class PluginRegistry:
     """Unified plugin and command registry"""
@@ -30,21 +43,18 @@ class PluginRegistry:
             self.ui.debug(f"Plugin paths from config: {plugin_paths}")
             
             # Verify home directory is being properly resolved
-            home_dir = str(Path.home())
-            self.ui.debug(f"Home directory: {home_dir}")
+            self.ui.debug(f"Home directory: {_HOME}")
             
             # If the path uses ~, show the expanded version
             if plugin_paths and isinstance(plugin_paths, list) and plugin_paths[0]:
                 if plugin_paths[0].startswith('~'):
-                    expanded = str(Path(plugin_paths[0]).expanduser())
-                    self.ui.debug(f"Expanded plugin path: {expanded}")
+                    self.ui.debug(f"Expanded plugin path: {_expand(plugin_paths[0])}")
 
         # Initialize discovery system with explicit parameters
         self.discovery = PluginDiscovery(ui=self.ui, config=self.config)
 
         # Log the actual plugin directory being used
-        if self.debug:
-            self.ui.debug(f"Actual plugin directory: {self.discovery.plugins_dir}")
+        self._dbg("Actual plugin directory: %s", self.discovery.plugins_dir)
 
         # Command pipeline reference from CLI
         self.command_pipeline = cli.command_pipeline
@@ -52,85 +62,234 @@ class PluginRegistry:
         # Storage
         self.plugins: Dict[str, Plugin] = {}
         self.commands: Dict[str, BaseCommand] = {}
-        self._load_order: List[str] = []
-
-        # Command category tracking
-        self.command_categories: Dict[str, List[str]] = {
-            'core': [],  # Built-in commands
-            'plugin': [],  # Plugin-provided commands
-            'admin': [],  # Administrative commands
+        # Loaded plugin names in load order (an insertion-ordered set)
+        self._load_order: Dict[str, None] = {}
+        # Plugin name -> names of loaded plugins that depend on it
+        self._dependents: Dict[str, Set[str]] = {}
+        # Plugin name -> command names from its get_commands() at load time
+        self._plugin_commands: Dict[str, Tuple[str, ...]] = {}
+
+        # While loading enabled plugins at startup, per-plugin plugin_loaded
+        # events are collected and sent as one plugins_loaded event
+        self._bulk_loading = False
+        self._pending_loaded: List[Dict[str, str]] = []
+
+        # Plugins whose loading is deferred until one of their commands runs:
+        # name -> (class, instance built at startup, dependencies to load first)
+        self.eager_load = self.config.get('plugins.eager_load', True)
+        self._lazy_plugins: Dict[str, Tuple[Type[Plugin], Plugin, List[str]]] = {}
+
+        # Discovery results and plugin versions, reused until refreshed
+        self._discovery_cache: Optional[Dict[str, Type[Plugin]]] = None
+        self._version_cache: Dict[str, str] = {}
+
+        # Command category tracking; categories are insertion-ordered sets
+        # (dict keys) with a reverse index for O(1) removal
+        self.command_categories: Dict[str, Dict[str, None]] = {
+            'core': {},  # Built-in commands
+            'plugin': {},  # Plugin-provided commands
+            'admin': {},  # Administrative commands
         }
+        self._command_category: Dict[str, str] = {}
 
         # Load enabled plugins
         self._load_enabled_plugins()
 
+    def _dbg(self, fmt: str, *args) -> None:
+        """Show a debug message, formatting it only when debug output is on"""
+        if self.debug:
+            self.ui.debug(fmt % args if args else fmt)
+
     def _load_enabled_plugins(self) -> None:
         """Load all enabled plugins from configuration"""
+        self._bulk_loading = True
         try:
-            if self.debug:
-                self.ui.debug("Starting plugin loading process...")
+            self._load_configured_plugins()
+        finally:
+            self._bulk_loading = False
+            loaded, self._pending_loaded = self._pending_loaded, []
+            if loaded:
+                self.events.emit(Event(name="plugins_loaded", data={"plugins": loaded}))
+
+    def _load_configured_plugins(self) -> None:
+        """Discover plugins and load those enabled in the configuration"""
+        try:
+            self._dbg("Starting plugin loading process...")
 
             # Discover available plugins
-            available_plugins = self.discovery.discover_plugins()
-            if self.debug:
-                self.ui.debug(f"Discovered plugins: {list(available_plugins.keys())}")
+            available_plugins = self._get_discovered()
+            self._dbg("Discovered plugins: %s", available_plugins.keys())
 
             # Get enabled/disabled lists
             enabled_plugins = self.config.get('plugins.enabled', [])
             disabled_plugins = self.config.get('plugins.disabled', [])
             auto_load = self.config.get('plugins.auto_load', True)
 
-            if self.debug:
-                self.ui.debug(f"Auto-load setting: {auto_load}")
-                self.ui.debug(f"Enabled plugins: {enabled_plugins}")
-                self.ui.debug(f"Disabled plugins: {disabled_plugins}")
+            self._dbg("Auto-load setting: %s", auto_load)
+            self._dbg("Enabled plugins: %s", enabled_plugins)
+            self._dbg("Disabled plugins: %s", disabled_plugins)
 
             if auto_load:
-                if self.debug:
-                    self.ui.debug("Auto-loading plugins...")
-
-                for plugin_name, plugin_class in available_plugins.items():
-                    if plugin_name not in disabled_plugins:
-                        if self.debug:
-                            self.ui.debug(f"Attempting to load plugin: {plugin_name}")
-                            self.ui.debug(f"Plugin class: {plugin_class}")
-
-                        try:
-                            self.load_plugin(plugin_class)
-                            if self.debug:
-                                self.ui.debug(f"Successfully loaded plugin: {plugin_name}")
-                                plugin = self.plugins.get(plugin_name)
-                                if plugin:
-                                    commands = plugin.get_commands()
-                                    self.ui.debug(f"Plugin commands: {list(commands.keys())}")
-                        except Exception as e:
-                            self.ui.error(f"Failed to load plugin {plugin_name}: {str(e)}")
+                self._dbg("Auto-loading plugins...")
+
+                to_load = [plugin_class for plugin_name, plugin_class in available_plugins.items()
+                           if plugin_name not in disabled_plugins]
+                for plugin_name, plugin_class, plugin in self._topo_sort(to_load):
+                    self._dbg("Attempting to load plugin: %s", plugin_name)
+
+                    try:
+                        self._add_plugin(plugin_class, plugin)
+                        self._dbg("Successfully loaded plugin: %s", plugin_name)
+                    except Exception as e:
+                        self.ui.error(f"Failed to load plugin {plugin_name}: {str(e)}")
             else:
-                if self.debug:
-                    self.ui.debug("Loading only explicitly enabled plugins...")
+                self._dbg("Loading only explicitly enabled plugins...")
                 # Load only explicitly enabled plugins
-                for plugin_name in enabled_plugins:
-                    if plugin_name in available_plugins and plugin_name not in disabled_plugins:
-                        if self.debug:
-                            self.ui.debug(f"Loading enabled plugin: {plugin_name}")
-                        self.load_plugin(available_plugins[plugin_name])
+                to_load = [available_plugins[plugin_name] for plugin_name in enabled_plugins
+                           if plugin_name in available_plugins and plugin_name not in disabled_plugins]
+                for plugin_name, plugin_class, plugin in self._topo_sort(to_load):
+                    self._dbg("Loading enabled plugin: %s", plugin_name)
+                    self._add_plugin(plugin_class, plugin)
 
         except Exception as e:
             self.error_handler.handle(
                 error=e,
                 category=ErrorCategory.PLUGIN,
-                operation="_load_enabled_plugins",
+                operation="_load_configured_plugins",
                 debug=self.debug
             )
 
-    def load_plugin(self, plugin_class: Type[Plugin]) -> None:
-        """Load and initialize a plugin"""
+    @staticmethod
+    def _class_label(plugin_class: Type[Plugin]) -> str:
+        """A plugin's name when set on the class, else its class name"""
+        name = inspect.getattr_static(plugin_class, 'name', None)
+        return name if isinstance(name, str) and name else plugin_class.__name__
+
+    def _read_metadata(self, plugin_class: Type[Plugin]) -> Tuple[str, List[str], Optional[Plugin]]:
+        """Read a plugin's name and dependencies, off the class when possible
+
+        Plugins declaring them as properties are instantiated; the instance
+        is returned so loading the plugin doesn't construct it again.
+        """
+        if any(isinstance(inspect.getattr_static(plugin_class, attr, None), property)
+               for attr in ('name', 'dependencies')):
+            plugin = plugin_class(self.ui, self.config, self.events)
+            return plugin.name, list(plugin.dependencies), plugin
+        return plugin_class.name, list(plugin_class.dependencies or []), None
+
+    def _topo_sort(self, classes: List[Type[Plugin]]) -> List[Tuple[str, Type[Plugin], Optional[Plugin]]]:
+        """Order plugins so dependencies load before their dependents
+
+        Returns (name, class, instance or None) for each plugin to load.
+        Dependencies outside the given classes are left for load_plugin to check.
+        Plugins whose metadata can't be read, plugins in a dependency cycle,
+        and plugins depending on them are reported and left out so the rest
+        can still load.
+        """
+        metadata = {}
+        for plugin_class in classes:
+            try:
+                name, dependencies, plugin = self._read_metadata(plugin_class)
+            except Exception as e:
+                self.ui.error(f"Failed to load plugin {self._class_label(plugin_class)}: {str(e)}")
+                continue
+            metadata[name] = (plugin_class, dependencies, plugin)
+
+        indegree = dict.fromkeys(metadata, 0)
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for name, (_, dependencies, _) in metadata.items():
+            for dep in dependencies:
+                if dep in metadata:
+                    indegree[name] += 1
+                    dependents[dep].append(name)
+
+        ready = deque(name for name, count in indegree.items() if count == 0)
+        ordered = []
+        while ready:
+            name = ready.popleft()
+            plugin_class, _, plugin = metadata[name]
+            ordered.append((name, plugin_class, plugin))
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+
+        # Whatever never became ready is in a cycle or waits on one
+        stuck = [name for name, count in indegree.items() if count > 0]
+        for name in stuck:
+            self.ui.error(f"Failed to load plugin {name}: dependency cycle among {', '.join(stuck)}")
+        return ordered
+
+    def _add_plugin(self, plugin_class: Type[Plugin], plugin: Optional[Plugin] = None) -> None:
+        """Load a plugin now, or register its commands to load it on first use
+
+        A plugin instance already built while reading metadata is reused.
+        """
+        if self.eager_load:
+            self.load_plugin(plugin_class, plugin)
+            return
+
+        # Constructing a plugin is cheap; initialize() and command setup are not
+        if plugin is None:
+            plugin = plugin_class(self.ui, self.config, self.events)
+        if not plugin.name:
+            raise PluginError("Plugin must have a name")
+        if plugin.name in self.plugins or plugin.name in self._lazy_plugins:
+            raise PluginError(f"Plugin {plugin.name} is already loaded")
+
+        commands = tuple(plugin.get_commands())
+        self._lazy_plugins[plugin.name] = (plugin_class, plugin, list(plugin.dependencies))
+        if not commands:
+            # No command would ever trigger loading it (e.g. a plugin that
+            # only subscribes to events), so load it and its dependencies now
+            self._ensure_loaded(plugin.name)
+            return
+
+        self._plugin_commands[plugin.name] = commands
+        loader = partial(self._ensure_loaded, plugin.name)
+        for cmd_name in commands:
+            self.cli.register_lazy_command(cmd_name, loader)
+
+        self._dbg("Deferred loading of plugin: %s", plugin.name)
+
+    def _ensure_loaded(self, name: str) -> None:
+        """Load a deferred plugin, and its deferred dependencies, if needed"""
+        if name in self.plugins:
+            return
+        if name not in self._lazy_plugins:
+            raise PluginError(f"Plugin {name} is not available")
+
+        plugin_class, plugin, dependencies = self._lazy_plugins[name]
+        for dep in dependencies:
+            if dep in self._lazy_plugins:
+                self._ensure_loaded(dep)
+        try:
+            self.load_plugin(plugin_class, plugin)
+        finally:
+            # Only a plugin that actually loaded stops being deferred
+            if name in self.plugins:
+                del self._lazy_plugins[name]
+
+    def _drop_deferred(self, name: str) -> None:
+        """Forget a deferred plugin and its placeholder commands"""
+        dependents = sorted(other for other, (_, _, dependencies) in self._lazy_plugins.items()
+                            if name in dependencies)
+        if dependents:
+            raise PluginError(f"Cannot unload {name}, required by: {', '.join(dependents)}")
+
+        del self._lazy_plugins[name]
+        for cmd_name in self._plugin_commands.pop(name, ()):
+            self.cli.unregister_command(cmd_name)
+        self._dbg("Dropped deferred plugin: %s", name)
+
+    def load_plugin(self, plugin_class: Type[Plugin], plugin: Optional[Plugin] = None) -> None:
+        """Load and initialize a plugin, optionally from an existing instance"""
         try:
             # Create plugin instance
-            plugin = plugin_class(self.ui, self.config, self.events)
+            if plugin is None:
+                plugin = plugin_class(self.ui, self.config, self.events)
 
-            if self.debug:
-                self.ui.debug(f"Created plugin instance: {plugin.name}")
+            self._dbg("Created plugin instance: %s", plugin.name)
 
             # Validate plugin
             if not plugin.name:
@@ -152,24 +311,26 @@ class PluginRegistry:
 
             # Register plugin
             self.plugins[plugin.name] = plugin
-            self._load_order.append(plugin.name)
+            self._load_order[plugin.name] = None
+            for dep in plugin.dependencies:
+                self._dependents.setdefault(dep, set()).add(plugin.name)
 
             # Register commands
             commands = plugin.get_commands()
+            self._plugin_commands[plugin.name] = tuple(commands)
             for cmd_name, cmd_class in commands.items():
-                if self.debug:
-                    self.ui.debug(f"Registering command: {cmd_name}")
+                self._dbg("Registering command: %s", cmd_name)
                 self.cli.register_plugin_command(cmd_name, cmd_class)
 
             # Emit plugin loaded event
-            self.events.emit(Event(
-                name="plugin_loaded",
-                data={
-                    "plugin_name": plugin.name,
-                    "version": plugin.version
-                },
-                timestamp=datetime.now()
-            ))
+            loaded = {
+                "plugin_name": plugin.name,
+                "version": plugin.version
+            }
+            if self._bulk_loading:
+                self._pending_loaded.append(loaded)
+            else:
+                self.events.emit(Event(name="plugin_loaded", data=loaded))
 
             if self.debug:
                 self.ui.success(f"Successfully loaded plugin: {plugin.name} v{plugin.version}")
@@ -193,12 +354,10 @@ class PluginRegistry:
             self.commands[name] = command_instance
 
             # Track command category
-            if category not in self.command_categories:
-                self.command_categories[category] = []
-            self.command_categories[category].append(name)
+            self.command_categories.setdefault(category, {})[name] = None
+            self._command_category[name] = category
 
-            if self.debug:
-                self.ui.debug(f"Registered command: {name} ({category})")
+            self._dbg("Registered command: %s (%s)", name, category)
 
         except Exception as e:
             self.error_handler.handle(
@@ -212,71 +371,109 @@ class PluginRegistry:
         """Get a command instance by name"""
         return self.commands.get(name)
 
-    def get_available_plugins(self) -> Dict[str, str]:
+    def _get_discovered(self, refresh: bool = False) -> Dict[str, Type[Plugin]]:
+        """Get discovered plugin classes, running discovery only when needed"""
+        if refresh or self._discovery_cache is None:
+            self._discovery_cache = self.discovery.discover_plugins()
+            self._version_cache.clear()
+        return self._discovery_cache
+
+    def _read_version(self, plugin_class: Type[Plugin]) -> str:
+        """Read a plugin's version, instantiating it only for property versions"""
+        try:
+            if not isinstance(inspect.getattr_static(plugin_class, 'version', None), property):
+                return getattr(plugin_class, 'version', None) or "unknown"
+            return plugin_class(self.ui, self.config, self.events).version
+        except Exception:
+            return "unknown"
+
+    def get_available_plugins(self, refresh: bool = False) -> Dict[str, str]:
         """Get all available plugins and their versions"""
         plugins = {}
-        for name, plugin_class in self.discovery.discover_plugins().items():
-            try:
-                plugin = plugin_class(self.ui, self.config, self.events)
-                plugins[name] = plugin.version
-            except:
-                plugins[name] = "unknown"
+        versions = self._version_cache
+        for name, plugin_class in self._get_discovered(refresh).items():
+            version = versions.get(name)
+            if version is None:
+                version = self._read_version(plugin_class)
+                versions[name] = version
+            plugins[name] = version
         return plugins
 
-    def get_plugin_commands(self, plugin_name: str) -> List[str]:
-        """Get all command names provided by a plugin"""
-        if plugin_name not in self.plugins:
-            return []
-        return list(self.plugins[plugin_name].get_commands().keys())
+    def get_plugin_commands(self, plugin_name: str) -> Tuple[str, ...]:
+        """Get all command names provided by a loaded or deferred plugin"""
+        return self._plugin_commands.get(plugin_name, ())
+
+    def get_plugin_info(self, plugin_name: str) -> Optional[Dict[str, object]]:
+        """Get a loaded or deferred plugin's version, dependencies and status"""
+        plugin = self.plugins.get(plugin_name)
+        if plugin is not None:
+            return {
+                'version': plugin.version,
+                'dependencies': list(plugin.dependencies),
+                'status': 'loaded',
+            }
+        deferred = self._lazy_plugins.get(plugin_name)
+        if deferred is not None:
+            _, plugin, dependencies = deferred
+            return {'version': plugin.version, 'dependencies': dependencies, 'status': 'deferred'}
+        return None
+
+    def get_plugin_names(self) -> List[str]:
+        """Get the names of loaded plugins, then deferred ones"""
+        return list(self.plugins) + [name for name in self._lazy_plugins if name not in self.plugins]
 
     def get_commands_by_category(self, category: str) -> List[str]:
         """Get all command names in a category"""
-        return self.command_categories.get(category, []).copy()
+        return list(self.command_categories.get(category, ()))
 
     def unload_plugin(self, name: str) -> None:
         """Unload a plugin and its commands"""
         try:
+            if name not in self.plugins and name in self._lazy_plugins:
+                self._drop_deferred(name)
+                return
+
             if name not in self.plugins:
                 raise PluginError(f"Plugin {name} is not loaded")
 
             plugin = self.plugins[name]
 
             # Check for dependent plugins
-            dependents = [p.name for p in self.plugins.values()
-                          if name in p.dependencies]
+            dependents = sorted(self._dependents.get(name, ()))
             if dependents:
                 raise PluginError(
                     f"Cannot unload {name}, required by: {', '.join(dependents)}"
                 )
 
             # Unregister commands
-            for cmd_name in list(self.commands.keys()):
-                if cmd_name in plugin.get_commands():
-                    del self.commands[cmd_name]
+            for cmd_name in self.commands.keys() & set(self._plugin_commands.pop(name, ())):
+                del self.commands[cmd_name]
 
-                    # Remove from categories
-                    for category in self.command_categories.values():
-                        if cmd_name in category:
-                            category.remove(cmd_name)
+                # Remove from its category
+                category = self._command_category.pop(cmd_name, None)
+                if category is not None:
+                    self.command_categories[category].pop(cmd_name, None)
 
             # Cleanup plugin
             plugin.cleanup()
 
             # Remove plugin
             del self.plugins[name]
-            self._load_order.remove(name)
+            self._load_order.pop(name, None)
+            self._dependents.pop(name, None)
+            for dep in plugin.dependencies:
+                if dep in self._dependents:
+                    self._dependents[dep].discard(name)
 
             # Emit plugin unloaded event
             self.events.emit(Event(
                 name="plugin_unloaded",
                 data={
                     "plugin_name": name
-                },
-                timestamp=datetime.now()
+                }
             ))
 
-            if self.debug:
-                self.ui.debug(f"Unloaded plugin: {name}")
+            self._dbg("Unloaded plugin: %s", name)
 
         except Exception as e:
             self.error_handler.handle(
@@ -293,9 +490,13 @@ class PluginRegistry:
 
         plugin_class = type(self.plugins[name])
         self.unload_plugin(name)
+        self._discovery_cache = None
         self.load_plugin(plugin_class)
 
     def cleanup(self) -> None:
-        """Clean up all plugins"""
-        for name in list(self.plugins.keys()):
+        """Clean up all plugins, most recently loaded first, then drop deferred ones"""
+        for name in reversed(list(self._load_order)):
+            self.unload_plugin(name)
+        # Dependents were added after their dependencies
+        for name in reversed(list(self._lazy_plugins)):
             self.unload_plugin(name)
@@ -1,6 +1,6 @@
 # chui/protocols.py
 
-from typing import Protocol, Type, runtime_checkable
+from typing import Callable, Protocol, Type, runtime_checkable
 from .commands import BaseCommand
 
 
@@ -12,6 +12,10 @@ class CLIProtocol(Protocol):
         """Register a plugin command"""
         ...
 
+    def register_lazy_command(self, name: str, loader: Callable[[], None]) -> None:
+        """Register a command whose plugin is loaded by loader on first use"""
+        ...
+
     def get_command(self, name: str) -> BaseCommand:
         """Get a registered command"""
         ...
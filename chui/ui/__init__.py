@@ -5,24 +5,83 @@ This package provides enhanced UI components, displays, and utilities
 for building command-line interfaces in the CHUI framework.
 """
 
-from typing import Any, Dict, List, Optional, Union, TypeVar, Generic
+from typing import Any, Dict, List, Optional, Tuple, Union, TypeVar, Generic, TYPE_CHECKING
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain, repeat
 import os
 import sys
 
 from rich.console import Console
 import cmd2
 
+from ._lazy import lazy_exports
 from .core import BaseUI
-from .capabilities import UICapabilities
+from .capabilities import UICapabilities, get_capabilities, reset_capabilities
 from .pagination import Paginator, Page, FilterablePaginator
-from .displays.tables import TableDisplayManager, TableConfig, TableBuilder, ColumnConfig
+from .displays.tables import TableDisplayManager, TableConfig, TableBuilder, ColumnConfig, ColumnAlign
 from .displays.panels import PanelManager, PanelType, PanelSection
-from .components.forms import FormManager, FormField, FormResult
-from .components.selector import ListSelector, SelectionMode, SelectionResult
+
+if TYPE_CHECKING:
+    from .components.forms import FormManager, FormField, FormResult
+    from .components.selector import SelectionMode, SelectionResult
 
 
 T = TypeVar('T')
 
+# Endless padding for rows shorter than their headers
+_NO_VALUES = repeat(None)
+
+
+def _dict_column(i: int, column: Dict[str, Any]) -> ColumnConfig:
+    """Build a column from a column configuration dict"""
+    name = column['name']
+    align = column.get('align')
+    return ColumnConfig(
+        name=name,
+        header=column.get('header') or "",  # Empty means ColumnConfig derives it
+        width=column.get('width'),
+        # Accept "right" as well as ColumnAlign.RIGHT; unset means left
+        align=ColumnAlign(align) if align else ColumnAlign.LEFT,
+        style=column.get('style'),
+        format_func=column.get('format_func'),
+        display_index=i
+    )
+
+
+def _build_table_config(columns: List[Union[str, Dict[str, Any]]],
+                        title: Optional[str]) -> TableConfig:
+    """Build a table config from column names or column configuration dicts"""
+    return TableConfig(
+        title=title,
+        columns=[
+            ColumnConfig(name=column, display_index=i)
+            if isinstance(column, str) else _dict_column(i, column)
+            for i, column in enumerate(columns)
+        ]
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_table_config(frozen_columns: Tuple, title: Optional[str]) -> TableConfig:
+    """Build a table config from hashable column specs, reused across renders"""
+    return _build_table_config(
+        [c if isinstance(c, str) else dict(c) for c in frozen_columns],
+        title
+    )
+
+
+def _table_config(columns: List[Union[str, Dict[str, Any]]],
+                  title: Optional[str]) -> TableConfig:
+    """Get the (shared, read-only) table config for the given columns"""
+    frozen = tuple(c if isinstance(c, str) else tuple(sorted(c.items())) for c in columns)
+    try:
+        hash(frozen)
+    except TypeError:
+        # Column options that can't be hashed just skip the cache
+        return _build_table_config(columns, title)
+    return _cached_table_config(frozen, title)
+
 
 class UI(BaseUI):
     """
@@ -45,7 +104,15 @@ class UI(BaseUI):
         # Initialize component managers
         self.table_manager = TableDisplayManager(self.console)
         self.panel_manager = PanelManager(self.console)
-        self.form_manager = FormManager(self.console)
+        self._form_manager: Optional['FormManager'] = None
+
+    @property
+    def form_manager(self) -> 'FormManager':
+        """Form manager, created (and rich.prompt imported) on first use"""
+        if self._form_manager is None:
+            from .components.forms import FormManager
+            self._form_manager = FormManager(self.console)
+        return self._form_manager
         
     # Enhanced table methods
     def paginated_table(self,
@@ -66,31 +133,24 @@ class UI(BaseUI):
             page_size: Number of rows per page
             show_pagination: Whether to show pagination controls
         """
+        # Slice out the requested page first so only visible rows are converted
+        page_obj = Paginator(rows, page_size).get_page(page)
+
         # Convert rows to dict format for TableDisplayManager
-        dict_rows = []
-        for row in rows:
-            row_dict = {}
-            for i, header in enumerate(headers):
-                if i < len(row):
-                    row_dict[header.lower().replace(' ', '_')] = row[i]
-                else:
-                    row_dict[header.lower().replace(' ', '_')] = None
-            dict_rows.append(row_dict)
+        keys = [header.lower().replace(' ', '_') for header in headers]
+        # zip stops at the last key, so extra cells are dropped and short
+        # rows are padded with None
+        dict_rows = [dict(zip(keys, chain(row, _NO_VALUES))) for row in page_obj.items]
             
         # Create table config
         config = TableConfig(title=title)
-        for header in headers:
-            config.add_column(ColumnConfig(
-                name=header.lower().replace(' ', '_'),
-                header=header
-            ))
+        for key, header in zip(keys, headers):
+            config.add_column(ColumnConfig(name=key, header=header))
             
-        # Display the paginated table
-        self.table_manager.display_paginated_table(
-            dict_rows,
+        # Display the page, keeping the totals of the full row list
+        self.table_manager.display_page(
+            replace(page_obj, items=dict_rows),
             config,
-            page=page,
-            page_size=page_size,
             show_pagination=show_pagination
         )
         
@@ -108,28 +168,8 @@ class UI(BaseUI):
             title: Optional table title
             style: Optional style for the table
         """
-        # Create table config
-        config = TableConfig(title=title)
+        config = _table_config(columns, title)
         
-        # Add columns
-        for i, column in enumerate(columns):
-            if isinstance(column, str):
-                config.add_column(ColumnConfig(
-                    name=column,
-                    header=column.replace('_', ' ').title(),
-                    display_index=i
-                ))
-            else:
-                config.add_column(ColumnConfig(
-                    name=column['name'],
-                    header=column.get('header', column['name'].replace('_', ' ').title()),
-                    width=column.get('width'),
-                    align=column.get('align'),
-                    style=column.get('style'),
-                    format_func=column.get('format_func'),
-                    display_index=i
-                ))
-                
         # Display table
         self.table_manager.display_table(data, config)
         
@@ -147,28 +187,8 @@ class UI(BaseUI):
             title: Optional table title
             page_size: Number of rows per page
         """
-        # Create table config
-        config = TableConfig(title=title)
+        config = _table_config(columns, title)
         
-        # Add columns
-        for i, column in enumerate(columns):
-            if isinstance(column, str):
-                config.add_column(ColumnConfig(
-                    name=column,
-                    header=column.replace('_', ' ').title(),
-                    display_index=i
-                ))
-            else:
-                config.add_column(ColumnConfig(
-                    name=column['name'],
-                    header=column.get('header', column['name'].replace('_', ' ').title()),
-                    width=column.get('width'),
-                    align=column.get('align'),
-                    style=column.get('style'),
-                    format_func=column.get('format_func'),
-                    display_index=i
-                ))
-                
         # Display interactive table
         self.table_manager.interactive_table(data, config, page_size=page_size)
         
@@ -211,8 +231,8 @@ class UI(BaseUI):
         
     # Form methods
     def input_form(self,
-                  fields: List[FormField],
-                  title: Optional[str] = None) -> FormResult:
+                  fields: List['FormField'],
+                  title: Optional[str] = None) -> 'FormResult':
         """
         Display an interactive form and collect user input
         
@@ -241,10 +261,11 @@ class UI(BaseUI):
         Returns:
             Selected option or None if cancelled
         """
-        selector = ListSelector(
+        from .components import selector as _selector
+        selector = _selector.ListSelector(
             console=self.console,
             items=options,
-            mode=SelectionMode.SINGLE,
+            mode=_selector.SelectionMode.SINGLE,
             title=title,
             instruction=instruction
         )
@@ -283,6 +304,8 @@ class UI(BaseUI):
 __all__ = [
     'UI',
     'UICapabilities',
+    'get_capabilities',
+    'reset_capabilities',
     'Paginator',
     'Page',
     'FilterablePaginator',
@@ -295,4 +318,17 @@ __all__ = [
     'FormResult',
     'SelectionMode',
     'SelectionResult'
-]
\ No newline at end of file
+]
+
+
+# Form and selector classes are imported on first access (PEP 562)
+_LAZY_ATTRS = {
+    'FormManager': '.components.forms',
+    'FormField': '.components.forms',
+    'FormResult': '.components.forms',
+    'ListSelector': '.components.selector',
+    'SelectionMode': '.components.selector',
+    'SelectionResult': '.components.selector',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
@@ -0,0 +1,37 @@
+"""
+Lazy module attributes for CHUI UI packages.
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(module_name: str,
+                 attrs: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build a module's PEP 562 __getattr__ and __dir__ for lazily imported names
+
+    Args:
+        module_name: Name of the module getting the attributes (its __name__)
+        attrs: Attribute name -> module it is imported from, relative to module_name
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        source = attrs.get(name)
+        if source is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(import_module(source, module_name), name)
+        # Cached on the module so later lookups skip __getattr__
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        # Lazy names show up in dir() and completion before first use
+        return sorted(set(vars(module)) | attrs.keys())
+
+    return __getattr__, __dir__
@@ -2,58 +2,127 @@
 Terminal capabilities detection and management for CHUI UI system.
 """
 
+import codecs
+import functools
 import os
 import platform
 import sys
-from typing import Optional
+import time
+from typing import Optional, Tuple
+
+
+# Capabilities other than terminal size don't change within a process, so
+# they are detected once and shared by every UICapabilities instance
+
+@functools.lru_cache(maxsize=1)
+def _detect_system() -> str:
+    """Detect the operating system name"""
+    return platform.system().lower()
+
+
+# Console API handle, resolved once at import on Windows only
+if sys.platform == 'win32':
+    import ctypes
+    _KERNEL32 = ctypes.windll.kernel32
+else:
+    _KERNEL32 = None
+
+# Result of enabling VT processing on the Windows console; None until tried
+_VT_ENABLED: Optional[bool] = None
+
+
+def _enable_vt_mode() -> bool:
+    """Enable ANSI support in the legacy Windows console, at most once"""
+    global _VT_ENABLED
+    if _VT_ENABLED is not None:
+        return _VT_ENABLED
+    _VT_ENABLED = False
+    if _KERNEL32 is not None:
+        try:
+            import ctypes
+            handle = _KERNEL32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if _KERNEL32.GetConsoleMode(handle, ctypes.byref(mode)):
+                # Add ENABLE_PROCESSED_OUTPUT | ENABLE_WRAP_AT_EOL_OUTPUT |
+                # ENABLE_VIRTUAL_TERMINAL_PROCESSING, keeping flags others set
+                _VT_ENABLED = bool(_KERNEL32.SetConsoleMode(handle, mode.value | 7))
+        except Exception:
+            pass
+    return _VT_ENABLED
+
+
+# Set by Windows Terminal, VS Code and similar hosts, and by ANSICON
+_WINDOWS_COLOR_ENV = frozenset({'WT_SESSION', 'TERM_PROGRAM', 'ANSICON'})
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_color() -> bool:
+    """Detect color support with Windows-specific handling"""
+    env = os.environ
+    term = env.get('TERM', '')
+
+    if _detect_system() == 'windows':
+        # Windows 10+ generally supports color
+        # Check for known Windows terminals that support color
+        if term == 'xterm-256color' or not _WINDOWS_COLOR_ENV.isdisjoint(env.keys()):
+            return True
+        # Enable VT100 processing for legacy Windows console
+        return _enable_vt_mode()
+
+    # Unix-like systems
+    return (
+            'COLORTERM' in env or
+            term.endswith('-color') or
+            env.get('CLICOLOR', '0') == '1'
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_interactive() -> bool:
+    """Detect if terminal is interactive"""
+    try:
+        return sys.stdout.isatty()
+    except (AttributeError, ValueError, OSError):
+        # Missing (None under pythonw), replaced, closed or detached stdout;
+        # io.UnsupportedOperation is an OSError
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_unicode() -> bool:
+    """Detect if terminal supports Unicode"""
+    # codecs normalizes aliases such as UTF8 and utf_8 to 'utf-8'
+    try:
+        encoding = codecs.lookup(getattr(sys.stdout, 'encoding', None) or 'ascii').name
+    except LookupError:
+        return False
+    return encoding.startswith('utf')
 
 
 class UICapabilities:
     """Manages UI capabilities and feature detection"""
 
     def __init__(self):
-        self.system = platform.system().lower()
-        self.has_color = self._detect_color()
-        self.is_interactive = self._detect_interactive()
-        self.terminal_size = self._get_terminal_size()
-        self.unicode_support = self._detect_unicode()
-
-    def _detect_color(self) -> bool:
-        """Detect color support with Windows-specific handling"""
-        if self.system == 'windows':
-            # Windows 10+ generally supports color
-            # Check for known Windows terminals that support color
-            if (
-                    'WT_SESSION' in os.environ or  # Windows Terminal
-                    'TERM_PROGRAM' in os.environ or  # VS Code, etc.
-                    os.environ.get('TERM') == 'xterm-256color' or
-                    os.environ.get('ANSICON') is not None
-            ):
-                return True
-            # Enable VT100 processing for legacy Windows console
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
-            try:
-                # Enable ANSI support in legacy Windows console
-                kernel32.SetConsoleMode(
-                    kernel32.GetStdHandle(-11),  # STD_OUTPUT_HANDLE
-                    7  # ENABLE_PROCESSED_OUTPUT | ENABLE_WRAP_AT_EOL_OUTPUT | ENABLE_VIRTUAL_TERMINAL_PROCESSING
-                )
-                return True
-            except:
-                pass
-            return False
-
-        # Unix-like systems
-        return (
-                'COLORTERM' in os.environ or
-                os.environ.get('TERM', '').endswith('-color') or
-                os.environ.get('CLICOLOR', '0') == '1'
-        )
-
-    def _detect_interactive(self) -> bool:
-        """Detect if terminal is interactive"""
-        return os.isatty(sys.stdout.fileno())
+        self.system = _detect_system()
+        self.has_color = _detect_color()
+        self.is_interactive = _detect_interactive()
+        self.unicode_support = _detect_unicode()
+        # (monotonic time read, size), re-read once older than SIZE_TTL
+        self._size_cache: Tuple[float, Optional[os.terminal_size]] = (0.0, None)
+
+    # Short enough to follow a resize promptly, long enough to spare bursty
+    # output (e.g. large tables) a syscall per line
+    SIZE_TTL = 0.5
+
+    @property
+    def terminal_size(self) -> os.terminal_size:
+        """Current terminal size, which can change while running"""
+        stamp, size = self._size_cache
+        now = time.monotonic()
+        if size is None or now - stamp > self.SIZE_TTL:
+            size = self._get_terminal_size()
+            self._size_cache = (now, size)
+        return size
 
     def _get_terminal_size(self) -> os.terminal_size:
         """Get terminal size with fallback"""
@@ -62,13 +131,6 @@ class UICapabilities:
         except OSError:
             return os.terminal_size((80, 24))  # fallback size
 
-    def _detect_unicode(self) -> bool:
-        """Detect if terminal supports Unicode"""
-        try:
-            return sys.stdout.encoding.lower().startswith('utf')
-        except AttributeError:
-            return False
-            
     def get_terminal_width(self) -> int:
         """Get current terminal width"""
         return self.terminal_size.columns
@@ -79,4 +141,20 @@ class UICapabilities:
         
     def supports_feature(self, feature: str) -> bool:
         """Check if a specific UI feature is supported"""
-        return getattr(self, f"has_{feature}", False)
\ No newline at end of file
+        return getattr(self, f"has_{feature}", False)
+
+
+@functools.lru_cache(maxsize=1)
+def get_capabilities() -> UICapabilities:
+    """Shared capabilities for the process
+
+    Detection is frozen at the first call; only the terminal size is
+    refreshed afterwards.
+    """
+    return UICapabilities()
+
+
+def reset_capabilities() -> None:
+    """Clear cached detection so it runs again, e.g. after redirecting stdout"""
+    for detect in (_detect_system, _detect_color, _detect_interactive, _detect_unicode, get_capabilities):
+        detect.cache_clear()
@@ -5,27 +5,31 @@ This package provides interactive UI components such as forms and
 selectors for the CHUI framework.
 """
 
-from .forms import (
-    FormManager, 
-    FormField, 
-    FieldType, 
-    FieldValidator, 
-    FormResult,
-    create_string_field,
-    create_password_field,
-    create_choice_field,
-    create_boolean_field,
-    create_number_field
-)
+from .._lazy import lazy_exports
+
+# Public names resolved on first access (PEP 562), so importing one component
+# doesn't load the others
+_LAZY_ATTRS = {
+    'FormManager': '.forms',
+    'FormField': '.forms',
+    'FieldType': '.forms',
+    'FieldValidator': '.forms',
+    'FormResult': '.forms',
+    'create_string_field': '.forms',
+    'create_password_field': '.forms',
+    'create_choice_field': '.forms',
+    'create_boolean_field': '.forms',
+    'create_number_field': '.forms',
+    'ListSelector': '.selector',
+    'SelectionMode': '.selector',
+    'SelectionItem': '.selector',
+    'SelectionResult': '.selector',
+    'select_option': '.selector',
+    'select_multiple': '.selector',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
 
-from .selector import (
-    ListSelector,
-    SelectionMode,
-    SelectionItem,
-    SelectionResult,
-    select_option,
-    select_multiple
-)
 
 __all__ = [
     'FormManager',
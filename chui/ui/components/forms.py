@@ -4,13 +4,26 @@ Form components for CHUI UI system.
 This module provides interactive form elements for user input.
 """
 
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 import re
 
 from rich.console import Console
-from rich.prompt import Prompt, Confirm, IntPrompt, FloatPrompt
+
+from ..._compat import DATACLASS_SLOTS
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a field pattern once, however many fields share it"""
+    return re.compile(pattern)
+
+
+def _required(value: Any) -> bool:
+    """Check that a value was provided and is not a blank string"""
+    return value is not None and (type(value) is not str or (bool(value) and not value.isspace()))
 
 
 class FieldType(Enum):
@@ -24,7 +37,7 @@ class FieldType(Enum):
     MULTI_CHOICE = "multi_choice"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FieldValidator:
     """Validator for form field input"""
     func: Callable[[Any], bool]
@@ -41,7 +54,7 @@ class FieldValidator:
             return False, self.error_message
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FormField:
     """Configuration for a form field"""
     name: str
@@ -57,6 +70,8 @@ class FormField:
     max_value: Optional[Union[int, float]] = None
     pattern: Optional[str] = None
     pattern_description: Optional[str] = None
+    # 1-based prompt input for each choice, built on first use
+    _choice_numbers: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate field configuration and add built-in validators"""
@@ -68,45 +83,76 @@ class FormField:
         self._add_builtin_validators()
     
     def _add_builtin_validators(self) -> None:
-        """Add built-in validators based on field configuration"""
+        """Add built-in validators based on field configuration
+
+        Built-ins run before user validators, cheapest first, since
+        interactive validation stops at the first failure.
+        """
+        builtin = []
+        
         # Required validator
         if self.required:
-            self.validators.append(FieldValidator(
-                lambda v: v is not None and (not isinstance(v, str) or v.strip() != ""),
+            builtin.append(FieldValidator(
+                _required,
                 "This field is required"
             ))
             
+        # Choice validator
+        if self.field_type == FieldType.CHOICE and self.choices:
+            choice_set = frozenset(self.choices)
+            builtin.append(FieldValidator(
+                lambda v, choice_set=choice_set: v in choice_set,
+                f"Value must be one of: {', '.join(self.choices)}"
+            ))
+            
         # Min/max value validators for numeric fields
         if self.field_type in (FieldType.INTEGER, FieldType.FLOAT):
             if self.min_value is not None:
-                self.validators.append(FieldValidator(
-                    lambda v: v >= self.min_value,
+                builtin.append(FieldValidator(
+                    lambda v, minimum=self.min_value: v >= minimum,
                     f"Value must be at least {self.min_value}"
                 ))
                 
             if self.max_value is not None:
-                self.validators.append(FieldValidator(
-                    lambda v: v <= self.max_value,
+                builtin.append(FieldValidator(
+                    lambda v, maximum=self.max_value: v <= maximum,
                     f"Value must be at most {self.max_value}"
                 ))
                 
         # Pattern validator for string fields
         if self.pattern and self.field_type == FieldType.STRING:
-            regex = re.compile(self.pattern)
-            self.validators.append(FieldValidator(
+            regex = _compile_pattern(self.pattern)
+            builtin.append(FieldValidator(
                 lambda v: bool(regex.match(v)),
                 self.pattern_description or f"Value must match pattern: {self.pattern}"
             ))
             
-        # Choice validator
-        if self.field_type == FieldType.CHOICE and self.choices:
-            self.validators.append(FieldValidator(
-                lambda v: v in self.choices,
-                f"Value must be one of: {', '.join(self.choices)}"
-            ))
+        # A new list, so a validators list shared between fields isn't extended
+        self.validators = builtin + self.validators
+
+    def choice_number(self, choice: Any) -> Optional[str]:
+        """Get the number a choice is entered as, or None if it isn't a choice"""
+        if self._choice_numbers is None:
+            numbers: Dict[str, str] = {}
+            for i, c in enumerate(self.choices or (), 1):
+                numbers.setdefault(c, str(i))  # First occurrence wins, like list.index
+            self._choice_numbers = numbers
+        try:
+            return self._choice_numbers.get(choice)
+        except TypeError:
+            return None
+
+    def validate_all(self, value: Any) -> List[str]:
+        """Run every validator, returning all error messages"""
+        errors = []
+        for validator in self.validators:
+            is_valid, error = validator.validate(value)
+            if not is_valid:
+                errors.append(error)
+        return errors
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FormResult:
     """Result of a form submission"""
     values: Dict[str, Any]
@@ -119,6 +165,16 @@ class FormManager:
     
     def __init__(self, console: Console):
         self.console = console
+        # Prompt handler per field type; other types are read as strings.
+        # Each returns (value, error) where error means "show it and ask again"
+        self._dispatch: Dict[FieldType, Callable[[FormField], Tuple[Any, Optional[str]]]] = {
+            FieldType.BOOLEAN: self._prompt_bool,
+            FieldType.INTEGER: self._prompt_int,
+            FieldType.FLOAT: self._prompt_float,
+            FieldType.PASSWORD: self._prompt_password,
+            FieldType.CHOICE: self._prompt_choice,
+            FieldType.MULTI_CHOICE: self._prompt_multi_choice,
+        }
         
     def display_form(self, 
                     fields: List[FormField],
@@ -133,126 +189,126 @@ class FormManager:
         Returns:
             FormResult with user input values and validation results
         """
+        # Bound once for the whole form rather than looked up per prompt
+        print_ = self.console.print
+        dispatch_get = self._dispatch.get
+        prompt_string = self._prompt_string
+
         if title:
-            self.console.print(f"[bold]{title}[/bold]\n")
+            print_(f"[bold]{title}[/bold]\n")
             
         values: Dict[str, Any] = {}
-        errors: Dict[str, List[str]] = {}
         
         for field in fields:
             # Display field description if provided
             if field.description:
-                self.console.print(f"[dim]{field.description}[/dim]")
+                print_(f"[dim]{field.description}[/dim]")
                 
             # Set up prompt based on field type
+            prompt_field = dispatch_get(field.field_type, prompt_string)
             value = None
-            field_errors = []
+            # Unpacked once so retries call the predicates directly
+            checks = [(validator.func, validator.error_message) for validator in field.validators]
             
             while True:
                 try:
-                    # Different prompt based on field type
-                    if field.field_type == FieldType.BOOLEAN:
-                        default = None if field.default is None else bool(field.default)
-                        value = Confirm.ask(
-                            field.label,
-                            default=default
-                        )
-                    elif field.field_type == FieldType.INTEGER:
-                        value = IntPrompt.ask(
-                            field.label,
-                            default=field.default
-                        )
-                    elif field.field_type == FieldType.FLOAT:
-                        value = FloatPrompt.ask(
-                            field.label,
-                            default=field.default
-                        )
-                    elif field.field_type == FieldType.PASSWORD:
-                        value = Prompt.ask(
-                            field.label,
-                            default=field.default,
-                            password=True
-                        )
-                    elif field.field_type == FieldType.CHOICE:
-                        # Show choices
-                        self.console.print(f"\n{field.label}")
-                        for i, choice in enumerate(field.choices, 1):
-                            self.console.print(f"  {i}. {choice}")
-                            
-                        # Get user choice
-                        choice_input = Prompt.ask(
-                            "Enter choice number",
-                            default=str(field.choices.index(field.default) + 1) if field.default in field.choices else None
-                        )
-                        
-                        try:
-                            choice_idx = int(choice_input) - 1
-                            if 0 <= choice_idx < len(field.choices):
-                                value = field.choices[choice_idx]
-                            else:
-                                raise ValueError()
-                        except (ValueError, IndexError):
-                            self.console.print("[red]Invalid choice[/red]")
-                            continue
-                    elif field.field_type == FieldType.MULTI_CHOICE:
-                        # Show choices
-                        self.console.print(f"\n{field.label}")
-                        for i, choice in enumerate(field.choices, 1):
-                            self.console.print(f"  {i}. {choice}")
-                            
-                        # Get user choices
-                        choice_input = Prompt.ask(
-                            "Enter choice numbers (comma-separated)",
-                            default=",".join(str(field.choices.index(c) + 1) for c in field.default) if isinstance(field.default, list) else None
-                        )
+                    value, error = prompt_field(field)
+                    if error:
+                        print_(f"[red]{error}[/red]")
+                        continue
                         
+                    # Validate the value, stopping at the first failure;
+                    # the user fixes one problem per retry anyway
+                    for check, error in checks:
                         try:
-                            choices = []
-                            for idx in choice_input.split(","):
-                                choice_idx = int(idx.strip()) - 1
-                                if 0 <= choice_idx < len(field.choices):
-                                    choices.append(field.choices[choice_idx])
-                                    
-                            value = choices
-                        except (ValueError, IndexError):
-                            self.console.print("[red]Invalid choice format[/red]")
-                            continue
-                    else:  # Default to string
-                        value = Prompt.ask(
-                            field.label,
-                            default=field.default
-                        )
-                        
-                    # Validate the value
-                    field_errors = []
-                    for validator in field.validators:
-                        is_valid, error = validator.validate(value)
+                            is_valid = check(value)
+                        except Exception:
+                            is_valid = False
                         if not is_valid:
-                            field_errors.append(error)
-                            
-                    if field_errors:
-                        for error in field_errors:
-                            self.console.print(f"[red]{error}[/red]")
+                            print_(f"[red]{error}[/red]")
+                            break
                     else:
                         break  # Valid input, move to next field
                         
                 except KeyboardInterrupt:
-                    self.console.print("\n[yellow]Form input cancelled[/yellow]")
+                    print_("\n[yellow]Form input cancelled[/yellow]")
                     return FormResult(values={}, valid=False)
                     
-            # Store the value
+            # Store the value; fields are only left once they validate
             values[field.name] = value
-            if field_errors:
-                errors[field.name] = field_errors
-                
-        # Validate the form as a whole
-        valid = len(errors) == 0
                 
-        return FormResult(
-            values=values,
-            valid=valid,
-            errors=errors
-        )
+        return FormResult(values=values, valid=True)
+
+    # rich.prompt is imported in the handlers so importing the UI package
+    # doesn't load rich's prompt machinery
+
+    def _prompt_string(self, field: FormField) -> Tuple[Any, Optional[str]]:
+        """Prompt for a plain string value"""
+        from rich.prompt import Prompt
+        return Prompt.ask(field.label, default=field.default), None
+
+    def _prompt_password(self, field: FormField) -> Tuple[Any, Optional[str]]:
+        """Prompt for a string without echoing it"""
+        from rich.prompt import Prompt
+        return Prompt.ask(field.label, default=field.default, password=True), None
+
+    def _prompt_bool(self, field: FormField) -> Tuple[Any, Optional[str]]:
+        """Prompt for a yes/no value"""
+        from rich.prompt import Confirm
+        default = None if field.default is None else bool(field.default)
+        return Confirm.ask(field.label, default=default), None
+
+    def _prompt_int(self, field: FormField) -> Tuple[Any, Optional[str]]:
+        """Prompt for an integer"""
+        from rich.prompt import IntPrompt
+        return IntPrompt.ask(field.label, default=field.default), None
+
+    def _prompt_float(self, field: FormField) -> Tuple[Any, Optional[str]]:
+        """Prompt for a float"""
+        from rich.prompt import FloatPrompt
+        return FloatPrompt.ask(field.label, default=field.default), None
+
+    def _show_choices(self, field: FormField) -> None:
+        """Print a field's label followed by its numbered choices"""
+        self.console.print(f"\n{field.label}\n" + "\n".join(
+            f"  {i}. {choice}" for i, choice in enumerate(field.choices, 1)
+        ))
+
+    def _prompt_choice(self, field: FormField) -> Tuple[Any, Optional[str]]:
+        """Prompt for one of the field's choices by number"""
+        from rich.prompt import Prompt
+        self._show_choices(field)
+        
+        # Get user choice
+        default = field.choice_number(field.default)
+        choice_input = Prompt.ask("Enter choice number", default=default)
+        
+        try:
+            choice_idx = int(choice_input) - 1
+        except (TypeError, ValueError):
+            return None, "Invalid choice"
+        if 0 <= choice_idx < len(field.choices):
+            return field.choices[choice_idx], None
+        return None, "Invalid choice"
+
+    def _prompt_multi_choice(self, field: FormField) -> Tuple[Any, Optional[str]]:
+        """Prompt for any number of the field's choices by number"""
+        from rich.prompt import Prompt
+        self._show_choices(field)
+        
+        # Get user choices
+        default = None
+        if isinstance(field.default, list):
+            numbers = (field.choice_number(c) for c in field.default)
+            default = ",".join(n for n in numbers if n is not None)
+        choice_input = Prompt.ask("Enter choice numbers (comma-separated)", default=default)
+        
+        try:
+            indices = [int(idx.strip()) - 1 for idx in choice_input.split(",")]
+        except (AttributeError, ValueError):
+            return None, "Invalid choice format"
+        count = len(field.choices)
+        return [field.choices[i] for i in indices if 0 <= i < count], None
 
 
 def create_string_field(name: str, 
@@ -7,15 +7,57 @@ This module provides interactive selection components for choosing from lists.
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Generic, Union
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from itertools import chain, compress
 
-from rich.console import Console
-from rich.table import Table
+from rich.cells import cell_len
+from rich.console import Console, Group
+from rich.segment import Segments
+from rich.table import Row, Table
 from rich.text import Text
-from rich.prompt import Prompt
 
 
 T = TypeVar('T')
 
+# Recognized (lowercased) replies to selector prompts
+_CANCEL = frozenset({'q', 'quit', 'exit', 'cancel'})
+_DONE = frozenset({'done', 'ok', 'finish'})
+_NAV = frozenset({'n', 'p', ''})
+
+# Pagination controls shown under every page
+_PAGE_FOOTER = ("\n[dim]Navigation: 'p' previous, 'n' next, "
+                "or enter item number to select. 'q' to cancel.[/dim]")
+
+
+def _add_rows(table: Table, *columns: List[Any]) -> None:
+    """Append rows of ready-made cells, given as one list per column
+
+    Extends rich's column cell lists directly rather than calling add_row per
+    row; the cells here are plain strings, which add_row would store as-is.
+    """
+    try:
+        cells = [column._cells for column in table.columns]
+        rows = table.rows
+    except AttributeError:
+        # Table internals changed; take the public route
+        for row in zip(*columns):
+            table.add_row(*row)
+        return
+    for column_cells, values in zip(cells, columns):
+        column_cells.extend(values)
+    rows.extend([Row() for _ in range(len(columns[0]))])
+
+
+@lru_cache(maxsize=1024)
+def _display_label(label: str, description: Optional[str], disabled: bool) -> str:
+    """Display markup for an item's label, description and disabled state"""
+    if description:
+        label += f"\n[dim]{description}[/dim]"
+        
+    if disabled:
+        label = f"[dim]{label} (disabled)[/dim]"
+    return label
+
 
 class SelectionMode(Enum):
     """Selection modes for list selectors"""
@@ -32,6 +74,11 @@ class SelectionItem(Generic[T]):
     description: Optional[str] = None  # Optional description
     disabled: bool = False  # Whether the item can be selected
     selected: bool = False  # Whether the item is selected
+    _display_label: str = field(default="", init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Markup shown in selector tables, shared between identical items
+        self._display_label = _display_label(self.label, self.description, self.disabled)
     
     def __str__(self) -> str:
         """String representation for display"""
@@ -46,6 +93,113 @@ class SelectionResult(Generic[T]):
     cancelled: bool = False  # Whether selection was cancelled
 
 
+class _Frame:
+    """Redraws a selector view in place
+
+    Instead of clearing the whole screen, each redraw moves the cursor back
+    over the rows written since the previous one (the view, prompts and
+    messages) and erases just those. Frames that don't fit on screen can't
+    be reached with cursor moves and are redrawn after a full clear.
+    """
+    
+    def __init__(self, console: Console):
+        self.console = console
+        self.height = 0  # Terminal rows written since the last draw
+        self.lines: List[str] = []  # Rendered rows of the current view
+        
+    def _render(self, renderable: Any) -> List[str]:
+        """Render to terminal output, one string per row at the console width"""
+        console = self.console
+        rows = console.render_lines(renderable, pad=False, new_lines=True)
+        with console.capture() as capture:
+            console.print(Segments(chain.from_iterable(rows)), end="")
+        return capture.get().splitlines(keepends=True)
+        
+    def _rows(self, cells: int) -> int:
+        """Rows taken by a line of the given cell width once it wraps"""
+        return max(1, -(-cells // self.console.width))
+        
+    def _can_move_cursor(self) -> bool:
+        """Whether the terminal takes cursor movement escapes"""
+        return self.console.is_terminal and not self.console.legacy_windows
+        
+    def _fits(self) -> bool:
+        """Whether the frame written so far is still entirely on screen"""
+        return self._can_move_cursor() and self.height < self.console.size.height
+        
+    def _write(self, lines: List[str]) -> None:
+        """Write rendered rows straight to the console's file"""
+        self.console.file.write("".join(lines))
+        self.console.file.flush()
+        
+    def show(self, renderable: Any) -> None:
+        """Replace the previously shown view with a new one"""
+        self._redraw(self._render(renderable))
+        
+    def _redraw(self, lines: List[str]) -> None:
+        """Replace the previously shown view with already rendered rows"""
+        console = self.console
+        if self.height:
+            if self._fits():
+                # Cursor to the start of the old view, then erase to the end of screen
+                console.file.write(f"\x1b[{self.height}F\x1b[J")
+            else:
+                console.clear()
+        self.lines = lines
+        self._write(lines)
+        self.height = len(lines)
+        
+    def ask(self, prompt: Callable[..., str], **kwargs) -> str:
+        """Prompt below the view; the answer line is erased on the next redraw"""
+        answer = prompt(**kwargs)
+        # The prompt and the echoed answer share one line, which may wrap
+        make_prompt = getattr(prompt, 'make_prompt', None)
+        prompt_cells = make_prompt(kwargs.get('default', ...)).cell_len if make_prompt else 0
+        self.height += self._rows(prompt_cells + cell_len(answer))
+        return answer
+        
+    def print(self, message: str) -> None:
+        """Print a message below the view"""
+        lines = self._render(message)
+        self._write(lines)
+        self.height += len(lines)
+        
+    def update(self, renderable: Any) -> None:
+        """Replace the view, rewriting only the lines that changed
+
+        Falls back to a full redraw when the layout changed height or the
+        frame isn't entirely on screen, where the rows to diff can't be
+        reached with cursor moves.
+        """
+        lines = self._render(renderable)
+        old = self.lines
+        if not self.height or len(lines) != len(old) or not self._fits():
+            self._redraw(lines)
+            return
+        # The frame's top is exactly height rows above the cursor, as every
+        # row written since the last draw is counted after wrapping. Walk down
+        # from there, skipping unchanged rows and erasing and rewriting
+        # changed ones, then clear the prompt rows below
+        out = [f"\x1b[{self.height}F"]
+        skip = 0
+        for line, previous in zip(lines, old):
+            if line == previous:
+                skip += 1
+                continue
+            if skip:
+                out.append(f"\x1b[{skip}E")
+                skip = 0
+            out.append("\x1b[2K")
+            out.append(line)
+        if skip:
+            out.append(f"\x1b[{skip}E")
+        out.append("\x1b[J")
+        self.console.file.write("".join(out))
+        self.console.file.flush()
+        self.lines = lines
+        self.height = len(lines)
+
+
 class ListSelector(Generic[T]):
     """Component for selecting items from a list"""
     
@@ -84,6 +238,27 @@ class ListSelector(Generic[T]):
                     label=self.convert_func(item)
                 ))
                 
+        # Parallel per-item arrays used by the display loops; self.items stays
+        # the public view and item.selected is kept in sync on toggle
+        self._values: List[T] = [item.value for item in self.items]
+        # Decorated labels, built once per item and reused by every redraw
+        self._labels: List[str] = [item._display_label for item in self.items]
+        # 1-based row numbers as shown in the tables
+        self._index_labels: List[str] = [str(i) for i in range(1, len(self.items) + 1)]
+        # One byte per item, so a toggle is an index flip
+        self._selected_mask = bytearray(item.selected for item in self.items)
+        self._disabled = bytearray(item.disabled for item in self.items)
+        self._prompt_instance: Optional[Callable[..., str]] = None
+        
+    @property
+    def _prompt(self) -> Callable[..., str]:
+        """Prompt for the instruction, built once and reused for every answer"""
+        if self._prompt_instance is None:
+            # rich.prompt is only imported once a selector runs
+            from rich.prompt import Prompt
+            self._prompt_instance = Prompt(self.instruction, console=self.console)
+        return self._prompt_instance
+                
     def display(self) -> SelectionResult[T]:
         """
         Display the selection list and get user selection
@@ -109,37 +284,29 @@ class ListSelector(Generic[T]):
         table.add_column("Option")
         
         # Add items to table
-        for i, item in enumerate(self.items, 1):
-            label = item.label
-            if item.description:
-                label += f"\n[dim]{item.description}[/dim]"
-                
-            if item.disabled:
-                label = f"[dim]{label} (disabled)[/dim]"
-                
-            table.add_row(str(i), label)
+        _add_rows(table, self._index_labels, self._labels)
             
         # Display table
         self.console.print(table)
         
         # Get user selection
         while True:
-            choice = Prompt.ask(self.instruction, default="1")
+            choice = self._prompt(default="1")
+            low = choice.lower()
             
             # Check for cancel
-            if choice.lower() in ('q', 'quit', 'exit', 'cancel'):
+            if low in _CANCEL:
                 return SelectionResult(selected=[], indices=[], cancelled=True)
                 
             try:
                 idx = int(choice) - 1
-                if 0 <= idx < len(self.items):
-                    item = self.items[idx]
-                    if item.disabled:
+                if 0 <= idx < len(self._values):
+                    if self._disabled[idx]:
                         self.console.print("[red]This option is disabled[/red]")
                         continue
                         
                     return SelectionResult(
-                        selected=[item.value],
+                        selected=[self._values[idx]],
                         indices=[idx],
                         cancelled=False
                     )
@@ -150,172 +317,141 @@ class ListSelector(Generic[T]):
                 
     def _display_multiple(self) -> SelectionResult[T]:
         """Display multiple-selection list"""
-        if self.title:
-            self.console.print(f"[bold]{self.title}[/bold]\n")
-            
-        # Create table for display
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Index", style="cyan")
-        table.add_column("Selected", style="green")
-        table.add_column("Option")
-        
-        # Add items to table
-        for i, item in enumerate(self.items, 1):
-            selected = "[green]✓[/green]" if item.selected else " "
-            
-            label = item.label
-            if item.description:
-                label += f"\n[dim]{item.description}[/dim]"
-                
-            if item.disabled:
-                label = f"[dim]{label} (disabled)[/dim]"
-                
-            table.add_row(str(i), selected, label)
-            
-        # Display table
-        self.console.print(table)
-        
-        # Show instructions
-        self.console.print("\n[dim]Toggle selections by entering numbers. "
-                           "Submit with 'done'. Cancel with 'q'.[/dim]")
+        frame = _Frame(self.console)
+        frame.show(self._multiple_view())
+        mask = self._selected_mask
         
         # Get user selections
         while True:
-            choice = Prompt.ask(self.instruction, default="done")
+            choice = frame.ask(self._prompt, default="done")
+            low = choice.lower()
             
             # Check for done/cancel
-            if choice.lower() in ('done', 'ok', 'finish'):
-                selected = []
-                indices = []
-                for i, item in enumerate(self.items):
-                    if item.selected:
-                        selected.append(item.value)
-                        indices.append(i)
-                        
+            if low in _DONE:
                 return SelectionResult(
-                    selected=selected,
-                    indices=indices,
+                    selected=list(compress(self._values, mask)),
+                    indices=list(compress(range(len(mask)), mask)),
                     cancelled=False
                 )
-            elif choice.lower() in ('q', 'quit', 'exit', 'cancel'):
+            elif low in _CANCEL:
                 return SelectionResult(selected=[], indices=[], cancelled=True)
                 
             # Toggle selection
             try:
                 idx = int(choice) - 1
-                if 0 <= idx < len(self.items):
-                    item = self.items[idx]
-                    if item.disabled:
-                        self.console.print("[red]This option is disabled[/red]")
+                if 0 <= idx < len(mask):
+                    if self._disabled[idx]:
+                        frame.print("[red]This option is disabled[/red]")
                         continue
                         
                     # Toggle selection
-                    item.selected = not item.selected
-                    
-                    # Redisplay table
-                    self.console.clear()
-                    if self.title:
-                        self.console.print(f"[bold]{self.title}[/bold]\n")
-                        
-                    # Recreate table
-                    table = Table(show_header=False, box=None, padding=(0, 1))
-                    table.add_column("Index", style="cyan")
-                    table.add_column("Selected", style="green")
-                    table.add_column("Option")
+                    mask[idx] ^= 1
+                    self.items[idx].selected = bool(mask[idx])
                     
-                    for i, item in enumerate(self.items, 1):
-                        selected = "[green]✓[/green]" if item.selected else " "
-                        label = item.label
-                        if item.description:
-                            label += f"\n[dim]{item.description}[/dim]"
-                        if item.disabled:
-                            label = f"[dim]{label} (disabled)[/dim]"
-                        table.add_row(str(i), selected, label)
-                        
-                    self.console.print(table)
-                    self.console.print("\n[dim]Toggle selections by entering numbers. "
-                                       "Submit with 'done'. Cancel with 'q'.[/dim]")
+                    # Only the toggled row's mark changes on screen
+                    frame.update(self._multiple_view())
                 else:
-                    self.console.print("[red]Invalid selection[/red]")
+                    frame.print("[red]Invalid selection[/red]")
             except ValueError:
-                if choice.lower() != "":
-                    self.console.print("[red]Please enter a number, 'done', or 'q'[/red]")
+                if low:
+                    frame.print("[red]Please enter a number, 'done', or 'q'[/red]")
                     
+    def _multiple_view(self) -> Group:
+        """Build the multiple-selection view from the cached labels"""
+        # Create table for display
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column("Index", style="cyan")
+        table.add_column("Selected", style="green")
+        table.add_column("Option")
+        
+        # Add items to table
+        marks = ["[green]✓[/green]" if is_selected else " " for is_selected in self._selected_mask]
+        _add_rows(table, self._index_labels, marks, self._labels)
+            
+        parts = [f"[bold]{self.title}[/bold]\n"] if self.title else []
+        parts.append(table)
+        
+        # Show instructions
+        parts.append("\n[dim]Toggle selections by entering numbers. "
+                     "Submit with 'done'. Cancel with 'q'.[/dim]")
+        return Group(*parts)
+        
     def _display_paginated(self) -> SelectionResult[T]:
         """Display paginated selection list"""
         # Similar to _display_single but with pagination
         page_size = 5
         current_page = 0
-        total_pages = (len(self.items) + page_size - 1) // page_size
+        count = len(self.items)
+        total_pages = (count + page_size - 1) // page_size
+        # Item range and title of each page, worked out once up front
+        page_ranges = [(start, min(start + page_size, count)) for start in range(0, count, page_size)] or [(0, 0)]
+        title_line = f"[bold]{self.title}[/bold]" if self.title else None
+        frame = _Frame(self.console)
+        shown_page = None
         
         while True:
-            self.console.clear()
-            
-            if self.title:
-                self.console.print(f"[bold]{self.title}[/bold] (Page {current_page + 1}/{total_pages})\n")
+            # Redraw only when the page changed, so messages stay visible
+            if current_page != shown_page:
+                start_idx, end_idx = page_ranges[current_page]
+                frame.show(self._page_view(title_line, current_page, total_pages, start_idx, end_idx))
+                shown_page = current_page
                 
-            # Create table for current page
-            table = Table(show_header=False, box=None, padding=(0, 1))
-            table.add_column("Index", style="cyan")
-            table.add_column("Option")
-            
-            # Calculate page range
-            start_idx = current_page * page_size
-            end_idx = min(start_idx + page_size, len(self.items))
-            
-            # Add items to table
-            for i in range(start_idx, end_idx):
-                item = self.items[i]
-                idx = i + 1  # 1-based index for display
-                
-                label = item.label
-                if item.description:
-                    label += f"\n[dim]{item.description}[/dim]"
-                    
-                if item.disabled:
-                    label = f"[dim]{label} (disabled)[/dim]"
-                    
-                table.add_row(str(idx), label)
-                
-            # Display table
-            self.console.print(table)
-            
-            # Show pagination controls
-            self.console.print("\n[dim]Navigation: 'p' previous, 'n' next, "
-                               "or enter item number to select. 'q' to cancel.[/dim]")
-            
             # Get user input
-            choice = Prompt.ask(self.instruction)
+            choice = frame.ask(self._prompt)
+            low = choice.lower()
             
             # Handle navigation
-            if choice.lower() == 'n' and current_page < total_pages - 1:
+            if low == 'n' and current_page < total_pages - 1:
                 current_page += 1
                 continue
-            elif choice.lower() == 'p' and current_page > 0:
+            elif low == 'p' and current_page > 0:
                 current_page -= 1
                 continue
-            elif choice.lower() in ('q', 'quit', 'exit', 'cancel'):
+            elif low in _CANCEL:
                 return SelectionResult(selected=[], indices=[], cancelled=True)
                 
             # Handle selection
             try:
                 idx = int(choice) - 1
-                if 0 <= idx < len(self.items):
-                    item = self.items[idx]
-                    if item.disabled:
-                        self.console.print("[red]This option is disabled[/red]")
+                if 0 <= idx < len(self._values):
+                    if self._disabled[idx]:
+                        frame.print("[red]This option is disabled[/red]")
                         continue
                         
                     return SelectionResult(
-                        selected=[item.value],
+                        selected=[self._values[idx]],
                         indices=[idx],
                         cancelled=False
                     )
                 else:
-                    self.console.print("[red]Invalid selection[/red]")
+                    frame.print("[red]Invalid selection[/red]")
             except ValueError:
-                if choice.lower() not in ('n', 'p', ''):
-                    self.console.print("[red]Please enter a number, 'n', 'p', or 'q'[/red]")
+                if low not in _NAV:
+                    frame.print("[red]Please enter a number, 'n', 'p', or 'q'[/red]")
+                    
+    def _page_view(self,
+                   title_line: Optional[str],
+                   current_page: int,
+                   total_pages: int,
+                   start_idx: int,
+                   end_idx: int) -> Group:
+        """Build the view for one page of the paginated selection list"""
+        parts = []
+        if title_line:
+            parts.append(f"{title_line} (Page {current_page + 1}/{total_pages})\n")
+            
+        # Create table for current page
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column("Index", style="cyan")
+        table.add_column("Option")
+        
+        # Add items to table
+        _add_rows(table, self._index_labels[start_idx:end_idx], self._labels[start_idx:end_idx])
+        parts.append(table)
+        
+        # Show pagination controls
+        parts.append(_PAGE_FOOTER)
+        return Group(*parts)
 
 
 # Utility functions to create selectors
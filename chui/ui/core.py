@@ -2,25 +2,71 @@
 Core UI functionality for CHUI framework.
 """
 
+import functools
+import importlib
+import io
 import os
 import sys
 from typing import Optional, Any, List, Dict, Union, Callable, Literal
 
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
-from rich.markdown import Markdown
 import cmd2
 
-from .capabilities import UICapabilities
-from .formatters import TextFormatter
+from .capabilities import get_capabilities, reset_capabilities
+from .formatters import TextFormatter, cached_markdown
+
+
+# rich renderables that not every command needs; imported on first use
+_LAZY_RICH = {
+    'Panel': 'rich.panel',
+    'Markdown': 'rich.markdown',
+    'Table': 'rich.table',
+}
+
+
+def _rich(name: str) -> Any:
+    """Get a lazily imported rich class, caching it as a module global"""
+    cls = globals().get(name)
+    if cls is None:
+        cls = getattr(importlib.import_module(_LAZY_RICH[name]), name)
+        globals()[name] = cls
+    return cls
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps core.Panel / core.Markdown importable from outside (PEP 562)
+    if name in _LAZY_RICH:
+        return _rich(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=8)
+def _color_system(system: str, term: str, colorterm: str, modern_windows_host: bool) -> str:
+    """Pick a rich color system from an environment snapshot"""
+    if system == 'windows':
+        # Windows 10+ can usually handle truecolor
+        if modern_windows_host:
+            return 'truecolor'
+        if term == 'xterm-256color':
+            return '256'
+        return 'windows'  # Fallback to basic Windows colors
+
+    # Unix-like systems
+    if colorterm in ('truecolor', '24bit'):
+        return 'truecolor'
+    if term.endswith('-256color'):
+        return '256'
+    return 'standard'
 
 
 class BaseUI:
     """Base UI class with core functionality"""
 
+    # Narrowest terminal that output is adjusted for
+    MIN_TERMINAL_WIDTH = 20
+
     def __init__(self, console: Optional[Console] = None, cmd: Optional[cmd2.Cmd] = None):
-        self.capabilities = UICapabilities()
+        self.capabilities = get_capabilities()
 
         # Initialize console with explicit color system
         if console is None:
@@ -35,41 +81,50 @@ class BaseUI:
         self.cmd = cmd
         self.formatter = TextFormatter()
 
+        # Message prefixes, chosen once for the terminal's unicode support
+        unicode_support = self.capabilities.unicode_support
+        self._ok_prefix = "✓ " if unicode_support else "* "
+        self._info_prefix = "ℹ " if unicode_support else "i "
+
+        # Styled output goes through rich only when the terminal has color
+        self._printer = self.console.print if self.capabilities.has_color else None
+
     def _detect_color_system(self) -> Optional[Literal['auto', 'standard', 'windows', 'truecolor', '256', None]]:
         """Detect appropriate color system based on terminal capabilities"""
         if not self.capabilities.has_color:
             return None
 
-        if self.capabilities.system == 'windows':
-            # Windows 10+ can usually handle truecolor
-            if 'WT_SESSION' in os.environ:  # Windows Terminal
-                return 'truecolor'
-            if 'TERM_PROGRAM' in os.environ:  # VS Code, etc.
-                return 'truecolor'
-            if os.environ.get('TERM') == 'xterm-256color':
-                return '256'
-            return 'windows'  # Fallback to basic Windows colors
-
-        # Unix-like systems
-        if os.environ.get('COLORTERM') in ('truecolor', '24bit'):
-            return 'truecolor'
-        if os.environ.get('TERM', '').endswith('-256color'):
-            return '256'
-        return 'standard'
+        env = os.environ
+        return _color_system(
+            self.capabilities.system,
+            env.get('TERM', ''),
+            env.get('COLORTERM', ''),
+            'WT_SESSION' in env or 'TERM_PROGRAM' in env  # Windows Terminal, VS Code, etc.
+        )
+
+    @staticmethod
+    def reset_capabilities() -> None:
+        """Forget detected terminal capabilities so the next UI re-detects them"""
+        reset_capabilities()
+        _color_system.cache_clear()
 
     def safe_print(self, content: str, style: Optional[str] = None) -> None:
         """Print with fallbacks for different terminal capabilities"""
+        if style and self._printer is not None:
+            try:
+                self._printer(content, style=style)
+                return
+            except Exception:
+                pass  # e.g. bad markup in content; print it plain instead
+        self._safe_print_fallback(content)
+
+    def _safe_print_fallback(self, content: str) -> None:
+        """Print without rich, stripping style markers for non-color output"""
         try:
-            if style and self.capabilities.has_color:
-                self.console.print(content, style=style)
-            else:
-                # Strip any remaining style markers for non-color output
-                content = self.formatter.strip_style_markers(content)
-                print(content)
-        except Exception as e:
-            # Ultimate fallback
-            content = self.formatter.strip_style_markers(content)
-            print(content)
+            text = self.formatter.strip_style_markers(content)
+        except Exception:
+            text = content  # Ultimate fallback: print it as given
+        print(text)
     
     def prompt(self, 
                message: str, 
@@ -79,6 +134,7 @@ class BaseUI:
         # Use cmd2's built-in input if available, otherwise fall back to rich
         if self.cmd:
             return self.cmd.read_input(message + ' ')
+        from rich.prompt import Prompt
         return Prompt.ask(message, choices=choices, default=default)
     
     def confirm(self, 
@@ -88,6 +144,7 @@ class BaseUI:
         if self.cmd:
             response = self.cmd.read_input(f"{message} [y/n] ").lower()
             return response.startswith('y')
+        from rich.prompt import Confirm
         return Confirm.ask(message, default=default)
     
     def select_from_list(self, 
@@ -95,26 +152,35 @@ class BaseUI:
                         message: str = "Select an option:",
                         show_indices: bool = True) -> Any:
         """Present a list of items for user selection"""
-        for idx, item in enumerate(items, 1):
-            self.console.print(f"{idx if show_indices else ''} {item}")
+        # Render the whole list at once rather than a print per item
+        if items:
+            self.console.print("\n".join(
+                f"{idx if show_indices else ''} {item}" for idx, item in enumerate(items, 1)
+            ))
+        from rich.prompt import Prompt
         
         while True:
             if self.cmd:
                 choice = self.cmd.read_input(f"{message} ")
             else:
-                choice = Prompt.ask(message, choices=[str(i) for i in range(1, len(items) + 1)])
+                # Validated below rather than by passing every index as a choice
+                choice = Prompt.ask(message)
             
             try:
-                return items[int(choice) - 1]
-            except (ValueError, IndexError):
-                self.error("Invalid selection, please try again")
+                idx = int(choice)
+            except ValueError:
+                idx = 0
+            # Checked explicitly, since a negative index would still succeed
+            if 1 <= idx <= len(items):
+                return items[idx - 1]
+            self.error("Invalid selection, please try again")
     
     def panel(self, 
              content: str, 
              title: Optional[str] = None,
              style: str = "none") -> None:
         """Display content in a panel"""
-        self.console.print(Panel(content, title=title, style=style))
+        self.console.print(_rich('Panel')(content, title=title, style=style))
     
     def error(self, message: str) -> None:
         """Display error message"""
@@ -122,8 +188,7 @@ class BaseUI:
     
     def success(self, message: str) -> None:
         """Display success message"""
-        self.safe_print(f"✓ {message}" if self.capabilities.unicode_support else "* {message}",
-                       style="green")
+        self.safe_print(f"{self._ok_prefix}{message}", style="green")
     
     def warning(self, message: str) -> None:
         """Display warning message"""
@@ -131,8 +196,7 @@ class BaseUI:
     
     def info(self, message: str) -> None:
         """Display info message"""
-        self.safe_print(f"ℹ {message}" if self.capabilities.unicode_support else "i {message}",
-                       style="blue")
+        self.safe_print(f"{self._info_prefix}{message}", style="blue")
     
     def debug(self, message: str) -> None:
         """Display debug message"""
@@ -147,21 +211,22 @@ class BaseUI:
     
     def link_list(self, links: List[Dict[str, str]], title: Optional[str] = None) -> None:
         """Display a list of clickable links with descriptions"""
-        if title:
-            self.console.print(f"\n[bold]{title}[/bold]")
+        # Rendered in a single print rather than one per line
+        parts = [f"\n[bold]{title}[/bold]"] if title else []
         
         for link in links:
             desc = link.get('description', '')
             if desc:
-                self.console.print(f"• {desc}")
-            self.console.print(f"  [link={link['url']}]{link['url']}[/link]")
+                parts.append(f"• {desc}")
+            url = link['url']
+            parts.append(f"  [link={url}]{url}[/link]")
         
-        self.console.print()
+        parts.append("")
+        self.console.print("\n".join(parts))
     
     def markdown_with_links(self, content: str) -> None:
         """Display markdown content that can contain clickable links"""
-        md = Markdown(content)
-        self.console.print(md)
+        self.console.print(cached_markdown(content))
 
     def get_terminal_width(self) -> int:
         """Get current terminal width"""
@@ -173,6 +238,9 @@ class BaseUI:
 
     def adjust_output_for_terminal(self, content: str, max_width: Optional[int] = None) -> str:
         """Adjust content to fit terminal constraints"""
+        if not max_width and len(content) <= self.MIN_TERMINAL_WIDTH:
+            # Fits any terminal we support, no need to ask for the width
+            return content
         width = max_width or self.get_terminal_width()
         if len(content) > width:
             return content[:width - 3] + "..."
@@ -184,26 +252,29 @@ class BaseUI:
              rows: List[List[Any]], 
              title: Optional[str] = None) -> None:
         """Display data in a formatted table"""
-        from rich.table import Table
-        
         if self.capabilities.is_interactive:
             # Use rich table for interactive terminals
-            table = Table(title=title)
+            table = _rich('Table')(title=title)
             for header in headers:
                 table.add_column(header)
             for row in rows:
-                table.add_row(*[str(cell) for cell in row])
+                table.add_row(*map(str, row))
             self.console.print(table)
         else:
-            # Fallback to simple format for non-interactive terminals
+            # Fallback to simple format for non-interactive terminals,
+            # buffered and written in one call rather than a print per row
+            buf = io.StringIO()
+            write = buf.write
             if title:
-                print(f"\n{title}")
-            # Print headers
-            print(" | ".join(headers))
-            print("-" * (sum(len(h) for h in headers) + (3 * (len(headers) - 1))))
-            # Print rows
+                write(f"\n{title}\n")
+            write(" | ".join(headers))
+            write("\n")
+            write("-" * (sum(map(len, headers)) + (3 * (len(headers) - 1))))
+            write("\n")
             for row in rows:
-                print(" | ".join(str(cell) for cell in row))
+                write(" | ".join(map(str, row)))
+                write("\n")
+            sys.stdout.write(buf.getvalue())
 
     # Methods to integrate with the extended modules that we'll implement
     def paginated_table(self, *args, **kwargs) -> None:
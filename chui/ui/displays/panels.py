@@ -18,7 +18,17 @@ from rich.align import Align
 from rich.padding import Padding
 from rich.columns import Columns
 from rich.text import Text
-from rich.markdown import Markdown
+
+from ..formatters import cached_markdown
+
+
+def _format_value(value: Any) -> str:
+    """Format a dict panel value, putting nested dicts and lists on indented lines"""
+    if isinstance(value, dict):
+        return "".join([f"\n  {k}: {v}" for k, v in value.items()])
+    if isinstance(value, list):
+        return "".join([f"\n  - {v}" for v in value]) if value else "[]"
+    return str(value)
 
 
 class PanelType(Enum):
@@ -84,6 +94,21 @@ class PanelManager:
     
     def __init__(self, console: Console):
         self.console = console
+        # Panel options for each default style, built once per manager
+        self._panel_kwargs: Dict[PanelType, Dict[str, Any]] = {
+            panel_type: self._style_kwargs(config)
+            for panel_type, config in self.DEFAULT_STYLES.items()
+        }
+        
+    @staticmethod
+    def _style_kwargs(style_config: PanelStyleConfig) -> Dict[str, Any]:
+        """Panel keyword arguments for a style configuration"""
+        return {
+            'title_align': "left",
+            'border_style': style_config.border_style,
+            'padding': style_config.padding,
+            'expand': style_config.expand,
+        }
         
     def display_panel(self,
                       content: str,
@@ -101,17 +126,12 @@ class PanelManager:
         """
         # Get style configuration
         if style_config is None:
-            style_config = self.DEFAULT_STYLES[panel_type]
+            panel_kwargs = self._panel_kwargs[panel_type]
+        else:
+            panel_kwargs = self._style_kwargs(style_config)
             
         # Create panel
-        panel = Panel(
-            content,
-            title=title,
-            title_align="left",
-            border_style=style_config.border_style,
-            padding=style_config.padding,
-            expand=style_config.expand
-        )
+        panel = Panel(content, title=title, **panel_kwargs)
         
         # Display panel
         self.console.print(panel)
@@ -144,9 +164,8 @@ class PanelManager:
                           content: str,
                           title: Optional[str] = None) -> None:
         """Display a help panel with markdown formatting"""
-        # Format content as markdown
-        md = Markdown(content)
-        self.display_panel(md, title, PanelType.HELP)
+        # Format content as markdown, reusing the parse of text seen before
+        self.display_panel(cached_markdown(content), title, PanelType.HELP)
         
     def display_dict_panel(self,
                           data: Dict[str, Any],
@@ -160,27 +179,11 @@ class PanelManager:
             title: Optional panel title
             panel_type: Type of panel
         """
-        # Format dictionary
-        content = []
-        
-        for key, value in data.items():
-            # Format key
-            formatted_key = key.replace('_', ' ').title()
-            
-            # Format value based on type
-            if isinstance(value, dict):
-                formatted_value = "\n  " + "\n  ".join(
-                    f"{k}: {v}" for k, v in value.items()
-                )
-            elif isinstance(value, list):
-                if value:
-                    formatted_value = "\n  - " + "\n  - ".join(str(v) for v in value)
-                else:
-                    formatted_value = "[]"
-            else:
-                formatted_value = str(value)
-                
-            content.append(f"[bold]{formatted_key}:[/bold] {formatted_value}")
+        # Format dictionary, one line (or block) per key
+        content = [
+            f"[bold]{key.replace('_', ' ').title()}:[/bold] {_format_value(value)}"
+            for key, value in data.items()
+        ]
             
         # Create and display panel
         self.display_panel("\n".join(content), title, panel_type)
@@ -233,24 +236,11 @@ class PanelManager:
             panel_type: Type of panels
         """
         # Get style configuration
-        style_config = self.DEFAULT_STYLES[panel_type]
+        panel_kwargs = self._panel_kwargs[panel_type]
         
         # Create panels
-        left_panel = Panel(
-            left_content,
-            title=left_title,
-            title_align="left",
-            border_style=style_config.border_style,
-            padding=style_config.padding
-        )
-        
-        right_panel = Panel(
-            right_content,
-            title=right_title,
-            title_align="left",
-            border_style=style_config.border_style,
-            padding=style_config.padding
-        )
+        left_panel = Panel(left_content, title=left_title, **panel_kwargs)
+        right_panel = Panel(right_content, title=right_title, **panel_kwargs)
         
         # Create columns layout
         columns = Columns([left_panel, right_panel])
@@ -10,9 +10,10 @@ This module provides enhanced table display capabilities including:
 - Pagination integration
 """
 
-from typing import Any, Dict, List, Optional, Union, Callable, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Union, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 import math
 
 from rich.console import Console
@@ -23,6 +24,28 @@ from rich.text import Text
 from ..pagination import Paginator, Page
 
 
+@lru_cache(maxsize=256)
+def _humanize(name: str) -> str:
+    """Default header for a column name, e.g. 'created_at' -> 'Created At'"""
+    return name.replace('_', ' ').title()
+
+
+def _format_cell(value: Any,
+                 format_func: Optional[Callable[[Any], str]],
+                 style: Optional[str]) -> Union[str, Text]:
+    """Format one table cell, applying the column's formatter and style"""
+    if value is None:
+        formatted_value = ""
+    elif format_func:
+        try:
+            formatted_value = format_func(value)
+        except Exception:
+            formatted_value = str(value)
+    else:
+        formatted_value = str(value)
+    return Text(formatted_value, style=style) if style else formatted_value
+
+
 class ColumnAlign(Enum):
     """Column alignment options"""
     LEFT = "left"
@@ -45,10 +68,18 @@ class ColumnConfig:
     max_width: Optional[int] = None
     display_index: int = 0  # For ordering columns
     visible: bool = True
+
+    # Bumped whenever any column's visibility or ordering changes
+    _layout_version: ClassVar[int] = 0
     
     def __post_init__(self):
         if not self.header:
-            self.header = self.name.replace('_', ' ').title()
+            self.header = _humanize(self.name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ('visible', 'display_index'):
+            ColumnConfig._layout_version += 1
+        object.__setattr__(self, name, value)
 
 
 @dataclass
@@ -65,20 +96,33 @@ class TableConfig:
     highlight_func: Optional[Callable[[Dict[str, Any]], bool]] = None
     highlight_style: str = "yellow"
     no_data_message: str = "No data available"
+    # Sorted visible columns and the column layout version they were built at
+    _visible_columns: Optional[Tuple[int, Tuple[ColumnConfig, ...]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == 'columns':
+            object.__setattr__(self, '_visible_columns', None)
+        object.__setattr__(self, name, value)
     
     def add_column(self, column: Union[str, ColumnConfig]) -> 'TableConfig':
         """Add a column to the table configuration"""
         if isinstance(column, str):
             column = ColumnConfig(name=column)
         self.columns.append(column)
+        self._visible_columns = None
         return self
     
-    def get_visible_columns(self) -> List[ColumnConfig]:
+    def get_visible_columns(self) -> Tuple[ColumnConfig, ...]:
         """Get only visible columns sorted by display_index"""
-        return sorted(
-            [col for col in self.columns if col.visible], 
-            key=lambda c: c.display_index
-        )
+        cached = self._visible_columns
+        if cached is None or cached[0] != ColumnConfig._layout_version:
+            columns = tuple(sorted(
+                (col for col in self.columns if col.visible),
+                key=lambda c: c.display_index
+            ))
+            cached = self._visible_columns = (ColumnConfig._layout_version, columns)
+        return cached[1]
 
 
 class TableDisplayManager:
@@ -122,37 +166,23 @@ class TableDisplayManager:
                 header_style=config.header_style
             )
             
+        # Per-column formatting decisions, looked up once rather than per cell
+        plan = [(column.name, column.format_func, column.style) for column in visible_columns]
+        row_styles = config.row_styles
+        highlight_func = config.highlight_func
+        
         # Add rows
         for i, row_data in enumerate(data):
             # Apply alternating row styles
-            row_style = config.row_styles[i % len(config.row_styles)] if config.row_styles else None
+            row_style = row_styles[i % len(row_styles)] if row_styles else None
             
             # Apply highlight if applicable
-            if config.highlight_func and config.highlight_func(row_data):
+            if highlight_func and highlight_func(row_data):
                 row_style = config.highlight_style
                 
             # Format row cells
-            cells = []
-            for column in visible_columns:
-                value = row_data.get(column.name, "")
-                
-                # Apply formatting if specified
-                if column.format_func and value is not None:
-                    try:
-                        formatted_value = column.format_func(value)
-                    except Exception:
-                        formatted_value = str(value)
-                else:
-                    formatted_value = str(value) if value is not None else ""
-                
-                # Apply styling
-                if column.style:
-                    cell = Text(formatted_value, style=column.style)
-                else:
-                    cell = formatted_value
-                    
-                cells.append(cell)
-                
+            get = row_data.get
+            cells = [_format_cell(get(name, ""), format_func, style) for name, format_func, style in plan]
             table.add_row(*cells, style=row_style)
             
         # Display the table
@@ -174,21 +204,33 @@ class TableDisplayManager:
             page_size: Number of items per page
             show_pagination: Whether to show pagination controls
         """
+        # Paginate the data
+        paginator = Paginator(data, page_size)
+        self.display_page(paginator.get_page(page), config, show_pagination)
+
+    def display_page(self,
+                     page: Page,
+                     config: TableConfig,
+                     show_pagination: bool = True) -> None:
+        """
+        Display an already paginated page of rows
+        
+        Args:
+            page: Page whose items are data rows (as dictionaries)
+            config: Table configuration
+            show_pagination: Whether to show pagination controls
+        """
         # Handle empty data case
-        if not data:
+        if not page.total_items:
             self.console.print(config.no_data_message, style="dim")
             return
             
-        # Paginate the data
-        paginator = Paginator(data, page_size)
-        page_obj = paginator.get_page(page)
-        
         # Display the current page
-        self.display_table(page_obj.items, config)
+        self.display_table(page.items, config)
         
         # Show pagination information if requested
         if show_pagination:
-            self._display_pagination_info(page_obj)
+            self._display_pagination_info(page)
             
     def _display_pagination_info(self, page: Page) -> None:
         """Display pagination information and controls"""
@@ -296,7 +338,7 @@ class TableBuilder:
         """Add a column to the table"""
         col_config = ColumnConfig(
             name=name,
-            header=header or name.replace('_', ' ').title(),
+            header=header or "",  # Empty headers default to the humanized name
             **kwargs
         )
         self.config.add_column(col_config)
@@ -2,8 +2,45 @@
 Text formatters for CHUI UI system.
 """
 
+import functools
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
+# Rich markup tags, using rich's own tag grammar: [/], [bold], [/red],
+# [bold red on white], [#ff0000], [link=https://...], [@click=...]. Text
+# like [INFO] or [1, 2] isn't markup to rich, and \[bold] is an escaped tag
+_RICH_MARKUP_RE = re.compile(r'(\\*)\[([a-z#/@][^[]*?)]')
+
+
+def _replace_tag(match: "re.Match[str]") -> str:
+    """Drop a tag, keeping escaped tags as literal text the way rich does"""
+    backslashes = match.group(1)
+    if not backslashes:
+        return ''
+    kept, escaped = divmod(len(backslashes), 2)
+    return '\\' * kept + (match.group(0)[len(backslashes):] if escaped else '')
+
+
+# Only short strings are memoized; long ones are rarely printed twice
+_STRIP_CACHE_MAX_LEN = 256
+
+
+@functools.lru_cache(maxsize=1024)
+def _strip_markup_cached(content: str) -> str:
+    """Strip markup from a short, frequently repeated message"""
+    return _RICH_MARKUP_RE.sub(_replace_tag, content)
+
+
+@functools.lru_cache(maxsize=128)
+def cached_markdown(content: str) -> "Markdown":
+    """Parse markdown once per distinct text; help text is redisplayed often"""
+    # rich.markdown is only imported once markdown is actually shown
+    from rich.markdown import Markdown
+    return Markdown(content)
 
 
 class TextFormatter:
@@ -12,23 +49,12 @@ class TextFormatter:
     @staticmethod
     def strip_style_markers(content: str) -> str:
         """Remove style markers from content for plain text output"""
+        if '[' not in content:
+            return content
         # Remove rich markup
-        content = content.replace('[red]', '')
-        content = content.replace('[green]', '')
-        content = content.replace('[blue]', '')
-        content = content.replace('[yellow]', '')
-        content = content.replace('[bold]', '')
-        content = content.replace('[italic]', '')
-        content = content.replace('[dim]', '')
-        content = content.replace('[/]', '')
-        content = content.replace('[/red]', '')
-        content = content.replace('[/green]', '')
-        content = content.replace('[/blue]', '')
-        content = content.replace('[/yellow]', '')
-        content = content.replace('[/bold]', '')
-        content = content.replace('[/italic]', '')
-        content = content.replace('[/dim]', '')
-        return content
+        if len(content) <= _STRIP_CACHE_MAX_LEN:
+            return _strip_markup_cached(content)
+        return _RICH_MARKUP_RE.sub(_replace_tag, content)
     
     @staticmethod
     def format_timestamp(timestamp: Union[str, datetime], format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
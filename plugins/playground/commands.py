@@ -37,8 +37,7 @@ class PlaygroundCommand(BaseCommand):
                 data={
                     "demo": "playground_main",
                     "timestamp": datetime.now().isoformat()
-                },
-                timestamp=datetime.now()
+                }
             )
             
             # Use the events module from the config if available
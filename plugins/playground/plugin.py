@@ -77,6 +77,10 @@ class PlaygroundPlugin(Plugin):
             self.ui.debug(f"Demo completed: {event.data.get('demo', 'unknown')}")
 
 
+# Tells plugin discovery which class to load
+PLUGIN_CLASS = PlaygroundPlugin
+
+
 def setup(cli: CLIProtocol) -> None:
     """Register plugin with the CLI"""
     try: